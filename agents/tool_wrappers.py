@@ -1,18 +1,52 @@
+import time
+from collections import OrderedDict
+from typing import Tuple
 from backend.app.services.mcp_bridge import mcp_bridge
 
 # AutoGen tools must be async functions that return strings.
 
+# In-process LRU for kb_search results: (normalized query, top_k) -> (stamp, result).
+# Entries expire after a TTL and the whole cache is dropped whenever the KB changes.
+_KB_SEARCH_CACHE: "OrderedDict[Tuple[str, int], Tuple[float, str]]" = OrderedDict()
+_KB_SEARCH_CACHE_MAX = 512
+_KB_SEARCH_CACHE_TTL_S = 300.0
+# Bumped on every clear so a search that was in flight across a KB change doesn't
+# repopulate the cache with a pre-change result.
+_KB_SEARCH_GEN = 0
+
+def clear_kb_search_cache() -> None:
+    global _KB_SEARCH_GEN
+    _KB_SEARCH_GEN += 1
+    _KB_SEARCH_CACHE.clear()
+
 async def mcp_extract_text(path: str) -> str:
     """Extract text from PDF/DOCX/HTML/TXT using MCP server."""
     return await mcp_bridge.call("extract_text", {"path": path})
 
 async def mcp_kb_add(doc_id: str, text: str) -> str:
     """Add text (with chunks separated by blank lines) into KB under doc_id."""
-    return await mcp_bridge.call("kb_add", {"doc_id": doc_id, "text": text})
+    try:
+        return await mcp_bridge.call("kb_add", {"doc_id": doc_id, "text": text})
+    finally:
+        clear_kb_search_cache()
 
 async def mcp_kb_search(query: str, top_k: int = 5) -> str:
     """Search KB; returns top_k chunks (joined)."""
-    return await mcp_bridge.call("kb_search", {"query": query, "top_k": top_k})
+    key = (query.strip().lower(), int(top_k))
+    now = time.monotonic()
+    hit = _KB_SEARCH_CACHE.get(key)
+    if hit is not None and now - hit[0] < _KB_SEARCH_CACHE_TTL_S:
+        _KB_SEARCH_CACHE.move_to_end(key)
+        return hit[1]
+    gen = _KB_SEARCH_GEN
+    result = await mcp_bridge.call("kb_search", {"query": query, "top_k": top_k})
+    if gen != _KB_SEARCH_GEN:
+        return result
+    _KB_SEARCH_CACHE[key] = (now, result)
+    _KB_SEARCH_CACHE.move_to_end(key)
+    if len(_KB_SEARCH_CACHE) > _KB_SEARCH_CACHE_MAX:
+        _KB_SEARCH_CACHE.popitem(last=False)
+    return result
 
 async def mcp_file_read(path: str) -> str:
     return await mcp_bridge.call("file_read", {"path": path})
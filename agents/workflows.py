@@ -6,22 +6,77 @@ Each workflow exposes a `run(...)` coroutine that:
 2) validates outputs using validators,
 3) raises ValidationError on failure.
 
+Validators run in a worker thread (asyncio.to_thread) because they scan the full
+source text and would otherwise stall every other request on the event loop.
+
 These are intentionally slim so you can swap validators or add richer logic later.
 """
 from __future__ import annotations
-from typing import List, Tuple
+import asyncio
+import io
+import re
+from typing import Awaitable, Callable, List, Optional, Tuple, TypeVar, Union
+from agents import system_prompts
 from backend.app.services.agent_registry import agent_registry
+from backend.app.services.usage_tracker import usage_tracker
+from backend.app.services import qa_cache
 from backend.app.services.validators import SummaryValidator, EntityValidator, QAValidator
 from backend.app.services.exceptions import ValidationError, SummarizationError, EntityExtractionError, QAError
 
+T = TypeVar("T")
+
+# Largest slice of source text sent to a model in one prompt
+MAX_PROMPT_CHARS = 120000
+
+def clip_text(text: str, n: int = MAX_PROMPT_CHARS) -> str:
+    """Truncate to n chars; returns the same object (no copy) when already short enough."""
+    return text if len(text) <= n else text[:n]
+
+async def _gather_bounded(
+    fn: Callable[[str], Awaitable[T]], items: List[str], max_parallel: int
+) -> List[Union[T, BaseException]]:
+    """Run fn over items concurrently, at most max_parallel in flight.
+
+    Results keep input order; a failed item yields its exception instead of raising.
+    """
+    sem = asyncio.Semaphore(max_parallel)
+
+    async def _one(item: str) -> T:
+        async with sem:
+            return await fn(item)
+
+    return await asyncio.gather(*(_one(i) for i in items), return_exceptions=True)
+
+def join_within(parts: List[str], sep: str, budget: int) -> str:
+    """Join parts with sep, stopping once budget characters have been written.
+
+    Equivalent to sep.join(parts)[:budget] without building the full string first.
+    """
+    buf = io.StringIO()
+    remaining = budget
+    for i, part in enumerate(parts):
+        if i:
+            buf.write(sep[:remaining])
+            remaining -= len(sep)
+        if remaining <= 0:
+            break
+        take = min(len(part), remaining)
+        buf.write(part if take == len(part) else part[:take])
+        remaining -= take
+        if remaining <= 0:
+            break
+    return buf.getvalue()
+
 class SectionSummarizationWorkflow:
     async def run(self, section_text: str) -> str:
         try:
-            res = await agent_registry.summarizer.run(
-                task="Summarize precisely the following section, keep it brief and factual:\n" + section_text[:120000]
+            res = await agent_registry.run(
+                "summarizer",
+                "Summarize precisely the following section, keep it brief and factual:\n" + clip_text(section_text),
             )
+            usage_tracker.record("summarizer", res)
             summary = str(res.messages[-1].content)
-            ok, info = SummaryValidator.validate(section_text, summary)
+            ok, info = await asyncio.to_thread(SummaryValidator.validate, section_text, summary)
             if not ok:
                 raise ValidationError("Section summary did not pass validation", info)
             return summary
@@ -33,11 +88,13 @@ class SectionSummarizationWorkflow:
 class DocumentSummarizationWorkflow:
     async def run(self, raw_text: str) -> str:
         try:
-            res = await agent_registry.summarizer.run(
-                task="Summarize the following document. Be concise, section-aware, <=300 words if possible:\n" + raw_text[:120000]
+            res = await agent_registry.run(
+                "summarizer",
+                "Summarize the following document. Be concise, section-aware, <=300 words if possible:\n" + clip_text(raw_text),
             )
+            usage_tracker.record("summarizer", res)
             summary = str(res.messages[-1].content)
-            ok, info = SummaryValidator.validate(raw_text, summary)
+            ok, info = await asyncio.to_thread(SummaryValidator.validate, raw_text, summary)
             if not ok:
                 raise ValidationError("Document summary did not pass validation", info)
             return summary
@@ -47,22 +104,48 @@ class DocumentSummarizationWorkflow:
             raise SummarizationError(str(e)) from e
 
 class CorpusSummarizationWorkflow:
+    """Map-reduce corpus summary: per-document summaries in parallel, then one synthesis call."""
+
+    def __init__(self, max_parallel: int = 4):
+        self.max_parallel = max_parallel
+
+    @staticmethod
+    async def _summarize_one(raw_text: str) -> str:
+        # Plain model call: a map step needs no tool loop or agent wrapper
+        summary = await agent_registry.complete(
+            "summarizer",
+            system_prompts.SUMMARIZER_PROMPT,
+            "Summarize the following document. Be concise, section-aware, <=300 words if possible:\n" + clip_text(raw_text),
+        )
+        ok, info = await asyncio.to_thread(SummaryValidator.validate, raw_text, summary)
+        if not ok:
+            raise ValidationError("Document summary did not pass validation", info)
+        return summary
+
     async def run(self, docs_texts: List[str]) -> str:
         try:
-            joined = "\n\n---\n\n".join(d[:80000] for d in docs_texts)[:120000]
-            res = await agent_registry.summarizer.run(
-                task=(
-                    "You will generate a high-level corpus summary across multiple documents. "
-                    "Surface common themes and key differences.\n\nCORPUS:\n" + joined
-                )
+            # Map: summarize each document concurrently, bounded to keep provider RPS sane
+            results = await _gather_bounded(self._summarize_one, docs_texts, self.max_parallel)
+            partials = [r for r in results if isinstance(r, str)]
+            if not partials:
+                raise SummarizationError("No document in the corpus could be summarized")
+
+            # Reduce: synthesize the partial summaries into one corpus summary
+            joined = join_within(partials, "\n---\n", MAX_PROMPT_CHARS)
+            res = await agent_registry.run(
+                "summarizer",
+                "You will generate a high-level corpus summary across multiple documents. "
+                "Surface common themes and key differences.\n"
+                "Synthesize a corpus summary from these doc summaries:\n" + joined,
             )
+            usage_tracker.record("summarizer", res)
             summary = str(res.messages[-1].content)
             # Validate against first doc as a proxy (loose)
-            ok, info = SummaryValidator.validate(docs_texts[0] if docs_texts else "", summary)
+            ok, info = await asyncio.to_thread(SummaryValidator.validate, docs_texts[0] if docs_texts else "", summary)
             if not ok:
                 raise ValidationError("Corpus summary did not pass validation", info)
             return summary
-        except ValidationError:
+        except (ValidationError, SummarizationError):
             raise
         except Exception as e:
             raise SummarizationError(str(e)) from e
@@ -70,11 +153,13 @@ class CorpusSummarizationWorkflow:
 class EntityExtractionWorkflow:
     async def run(self, raw_text: str) -> List[str]:
         try:
-            res = await agent_registry.entity_extractor.run(
-                task="Extract key entities (PERSON, ORG, DATE, MONEY, LOCATION, LAW/CLAUSE) one per line:\n" + raw_text[:120000]
+            res = await agent_registry.run(
+                "entity_extractor",
+                "Extract key entities (PERSON, ORG, DATE, MONEY, LOCATION, LAW/CLAUSE) one per line:\n" + clip_text(raw_text),
             )
+            usage_tracker.record("entity_extractor", res)
             entities = [e.strip() for e in str(res.messages[-1].content).splitlines() if e.strip()]
-            ok, info = EntityValidator.validate(raw_text, entities)
+            ok, info = await asyncio.to_thread(EntityValidator.validate, raw_text, entities)
             if not ok:
                 raise ValidationError("Entities did not pass validation", info)
             return entities
@@ -83,19 +168,51 @@ class EntityExtractionWorkflow:
         except Exception as e:
             raise EntityExtractionError(str(e)) from e
 
+# Question terms for the trivial-answer check; same tokenizer as the validators, so
+# trailing punctuation ("renewal?") does not drop a word
+_QUESTION_WORD_RE = re.compile(r"[a-z]+")
+
 class QAWorkflow:
+    NO_ANSWER = "I don't know from the provided documents."
+
+    @staticmethod
+    def _trivial_answer(question: str, contexts: List[str]) -> Optional[str]:
+        """Return a single short context verbatim when it plainly covers the question."""
+        if len(contexts) != 1 or len(contexts[0]) >= 200:
+            return None
+        terms = {t for t in _QUESTION_WORD_RE.findall(question.lower()) if len(t) > 3}
+        ctx_lower = contexts[0].lower()
+        if not terms or sum(1 for t in terms if t in ctx_lower) * 2 < len(terms):
+            return None
+        answer = f'From the provided documents: "{contexts[0].strip()}"'
+        # Same grounding check as LLM answers; on failure the question goes to the agent
+        ok, _ = QAValidator.validate(answer, contexts)
+        return answer if ok else None
+
     async def run(self, question: str, contexts: List[str]) -> Tuple[str, List[str]]:
+        if not any(c.strip() for c in contexts):
+            return self.NO_ANSWER, []
+        trivial = self._trivial_answer(question, contexts)
+        if trivial is not None:
+            return trivial, contexts
         try:
+            cached = await qa_cache.get(question, contexts)
+            if cached is not None:
+                return cached, contexts
             ctx_text = "\n\n".join(contexts)
+            # Static instruction first, then context, then the question: the stable
+            # part of the prompt stays a shared prefix the provider can cache.
             qa_task = (
-                f"Question: {question}\n\nContext:\n{ctx_text}\n\n"
-                "Answer strictly from the context; if unknown, say you don't know."
+                "Answer strictly from the context; if unknown, say you don't know.\n\n"
+                f"Context:\n{ctx_text}\n\nQuestion: {question}"
             )
-            res = await agent_registry.qa.run(task=qa_task)
+            res = await agent_registry.run("qa", qa_task)
+            usage_tracker.record("qa", res)
             answer = str(res.messages[-1].content)
-            ok, info = QAValidator.validate(answer, contexts)
+            ok, info = await asyncio.to_thread(QAValidator.validate, answer, contexts)
             if not ok:
                 raise ValidationError("QA answer did not pass validation", info)
+            await qa_cache.put(question, contexts, answer)
             return answer, contexts
         except ValidationError:
             raise
@@ -1,5 +1,5 @@
 from fastapi import FastAPI
-from backend.app.routes import ingest, summary, qa
+from backend.app.routes import ingest, summary, qa, usage
 from backend.app.services.mcp_bridge import mcp_bridge
 from backend.app.services.agent_registry import agent_registry
 
@@ -20,3 +20,4 @@ async def _shutdown():
 app.include_router(ingest.router)
 app.include_router(summary.router)
 app.include_router(qa.router)
+app.include_router(usage.router)
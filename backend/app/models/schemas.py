@@ -14,6 +14,7 @@ class SummaryUpdate(BaseModel):
 class QARequest(BaseModel):
     doc_id: Optional[str] = None     # if None, search whole corpus
     question: str
+    skip_kb: bool = False            # with doc_id, answer from the document's sections only
 
 class QAResponse(BaseModel):
     answer: str
@@ -1,4 +1,5 @@
 import os, tempfile
+import aiofiles, aiofiles.os
 from fastapi import APIRouter, UploadFile, HTTPException
 from storage.local_store import make_doc_id
 from backend.app.services.orchestrator import ingest_document
@@ -10,14 +11,18 @@ async def ingest(file: UploadFile):
     suffix = os.path.splitext(file.filename or "")[1].lower()
     if suffix not in [".pdf", ".docx", ".html", ".htm", ".txt"]:
         raise HTTPException(400, "Unsupported file format. Use PDF, DOCX, HTML, or TXT.")
-    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
-        content = await file.read()
-        tmp.write(content)
-        tmp_path = tmp.name
-    doc_id = make_doc_id(file.filename or "document")
-    sections, summary, entities = await ingest_document(tmp_path, doc_id)
+    fd, tmp_path = tempfile.mkstemp(suffix=suffix)
+    os.close(fd)
     try:
-        os.remove(tmp_path)
-    except Exception:
-        pass
+        # Stream to disk in 1 MiB blocks without blocking the event loop on writes
+        async with aiofiles.open(tmp_path, "wb") as tmp:
+            while chunk := await file.read(1 << 20):
+                await tmp.write(chunk)
+        doc_id = make_doc_id(file.filename or "document")
+        sections, summary, entities = await ingest_document(tmp_path, doc_id)
+    finally:
+        try:
+            await aiofiles.os.remove(tmp_path)
+        except Exception:
+            pass
     return {"doc_id": doc_id, "sections": sections, "summary": summary, "entities": entities}
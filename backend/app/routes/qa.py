@@ -6,5 +6,5 @@ router = APIRouter()
 
 @router.post("/qa")
 async def qa(payload: QARequest):
-    answer, contexts = await answer_question(payload.question, payload.doc_id)
+    answer, contexts = await answer_question(payload.question, payload.doc_id, skip_kb=payload.skip_kb)
     return {"answer": answer, "contexts": contexts}
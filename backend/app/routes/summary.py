@@ -8,22 +8,22 @@ router = APIRouter()
 
 @router.get("/summary/{doc_id}")
 async def get_summary(doc_id: str):
-    doc = get_document(doc_id)
+    doc = get_document(doc_id, with_raw=False)
     if not doc:
         raise HTTPException(404, "Document not found")
     return {"doc_id": doc_id, "summary": doc["summary"], "entities": doc["entities"], "sections": doc["sections"]}
 
 @router.put("/summary/{doc_id}")
 async def update_summary(doc_id: str, payload: SummaryUpdate):
-    doc = get_document(doc_id)
+    doc = get_document(doc_id, with_raw=False)
     if not doc:
         raise HTTPException(404, "Document not found")
-    apply_user_edit(doc_id, payload.summary, payload.entities)
+    await apply_user_edit(doc_id, payload.summary, payload.entities)
     return {"ok": True}
     
 @router.get("/reviews/{doc_id}")
 async def get_reviews(doc_id: str):
-    doc = get_document(doc_id)
+    doc = get_document(doc_id, with_raw=False)
     if not doc:
         raise HTTPException(404, "Document not found")
     return {"reviews": doc.get("reviews", []), "disagreements": doc.get("disagreements", [])}
\ No newline at end of file
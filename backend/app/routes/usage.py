@@ -0,0 +1,8 @@
+from fastapi import APIRouter
+from backend.app.services.usage_tracker import usage_tracker
+
+router = APIRouter()
+
+@router.get("/usage")
+async def get_usage():
+    return {"agents": usage_tracker.snapshot()}
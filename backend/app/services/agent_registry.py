@@ -1,6 +1,10 @@
 import asyncio
-from typing import List
+from typing import Any, Dict, List
+import httpx
+from openai import DefaultAsyncHttpxClient
 from autogen_agentchat.agents import AssistantAgent
+from autogen_agentchat.base import TaskResult
+from autogen_core.models import SystemMessage, UserMessage
 from autogen_ext.models.openai import AzureOpenAIChatCompletionClient
 from agents import system_prompts
 from agents.tool_wrappers import (
@@ -10,6 +14,7 @@ from agents.critics import (
     BIAS_REVIEW_PROMPT, COMPLETENESS_REVIEW_PROMPT,
     SECURITY_REVIEW_PROMPT, PERF_ANALYZER_PROMPT, DISAGREEMENT_ARBITER_PROMPT
 )
+from backend.app.services.usage_tracker import usage_tracker
 from shared.config import settings
 
 async def _azure_client():
@@ -19,102 +24,116 @@ async def _azure_client():
         api_version=settings.az_api_version,
         azure_endpoint=settings.az_endpoint,
         api_key=settings.az_api_key,
+        # Keep-alive pool shared by all agents, so concurrent
+        # critic/summary calls reuse warm TCP+TLS connections instead of redialing
+        http_client=DefaultAsyncHttpxClient(
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        ),
     )
 
+# Max in-flight requests per agent, sized to the deployment's rate limit so that
+# fan-outs (corpus/section summaries, batch entities, parallel critics) queue
+# locally instead of tripping 429 retry storms.
+_AGENT_CONCURRENCY = {
+    "summarizer": 8,
+    "entity_extractor": 4,
+}
+_DEFAULT_AGENT_CONCURRENCY = 4
+
 class AgentRegistry:
     def __init__(self):
         self._initialized = False
+        self._client = None
+        # Role name -> AssistantAgent kwargs (everything but the shared model client)
+        self._specs: Dict[str, Dict[str, Any]] = {}
+        self._sem: Dict[str, asyncio.Semaphore] = {
+            name: asyncio.Semaphore(n) for name, n in _AGENT_CONCURRENCY.items()
+        }
+
+    def slot(self, name: str) -> asyncio.Semaphore:
+        """Semaphore bounding concurrent requests for the named agent."""
+        sem = self._sem.get(name)
+        if sem is None:
+            sem = self._sem[name] = asyncio.Semaphore(_DEFAULT_AGENT_CONCURRENCY)
+        return sem
+
+    def _new_agent(self, name: str) -> AssistantAgent:
+        # AssistantAgent keeps the conversation in its model_context and its run() is
+        # not coroutine-safe, so each call gets its own; only the client is shared.
+        return AssistantAgent(name=name, model_client=self._client, **self._specs[name])
+
+    async def run(self, name: str, task: str) -> TaskResult:
+        """Run task on a fresh agent for the named role, within its concurrency limit."""
+        async with self.slot(name):
+            return await self._new_agent(name).run(task=task)
 
     async def init(self):
         if self._initialized: return
-        # Core agents (existing)
-        self.parser = AssistantAgent(
-            name="parser",
-            model_client=await _azure_client(),
-            system_message=system_prompts.PARSER_PROMPT,
-            tools=[mcp_extract_text, mcp_file_read],
-            reflect_on_tool_use=True,
-            model_client_stream=False,
-        )
-        self.summarizer = AssistantAgent(
-            name="summarizer",
-            model_client=await _azure_client(),
-            system_message=system_prompts.SUMMARIZER_PROMPT,
-            tools=[],
-            reflect_on_tool_use=False,
-            model_client_stream=False,
-        )
-        self.entity_extractor = AssistantAgent(
-            name="entity_extractor",
-            model_client=await _azure_client(),
-            system_message=system_prompts.ENTITY_PROMPT,
-            tools=[],
-            reflect_on_tool_use=False,
-            model_client_stream=False,
-        )
-        self.qa = AssistantAgent(
-            name="qa",
-            model_client=await _azure_client(),
-            system_message=system_prompts.QA_PROMPT,
-            tools=[mcp_kb_search],
-            reflect_on_tool_use=True,
-            model_client_stream=False,
-        )
-        self.kb = AssistantAgent(
-            name="kb_agent",
-            model_client=await _azure_client(),
-            system_message="You maintain the KB by calling tools; acknowledge once done.",
-            tools=[mcp_kb_add],
-            reflect_on_tool_use=True,
-        )
-
-        # === New critic/reviewer agents ===
-        self.bias_reviewer = AssistantAgent(
-            name="bias_reviewer",
-            model_client=await _azure_client(),
-            system_message=BIAS_REVIEW_PROMPT,
-            tools=[],
-            reflect_on_tool_use=False,
-        )
-        self.completeness_reviewer = AssistantAgent(
-            name="completeness_reviewer",
-            model_client=await _azure_client(),
-            system_message=COMPLETENESS_REVIEW_PROMPT,
-            tools=[],
-            reflect_on_tool_use=False,
-        )
-        self.security_reviewer = AssistantAgent(
-            name="security_reviewer",
-            model_client=await _azure_client(),
-            system_message=SECURITY_REVIEW_PROMPT,
-            tools=[],
-            reflect_on_tool_use=False,
-        )
-        self.perf_analyzer = AssistantAgent(
-            name="perf_analyzer",
-            model_client=await _azure_client(),
-            system_message=PERF_ANALYZER_PROMPT,
-            tools=[],
-            reflect_on_tool_use=False,
-        )
-        self.disagreement_arbiter = AssistantAgent(
-            name="disagreement_arbiter",
-            model_client=await _azure_client(),
-            system_message=DISAGREEMENT_ARBITER_PROMPT,
-            tools=[],
-            reflect_on_tool_use=False,
-        )
+        # One client (one HTTP pool / auth state) shared by every agent
+        self._client = await _azure_client()
+        self._specs = {
+            # Core agents (existing)
+            "parser": dict(
+                system_message=system_prompts.PARSER_PROMPT,
+                tools=[mcp_extract_text, mcp_file_read],
+                # No reflection turn: the orchestrator segments the extracted text locally
+                reflect_on_tool_use=False,
+                model_client_stream=False,
+            ),
+            "summarizer": dict(
+                system_message=system_prompts.SUMMARIZER_PROMPT,
+                tools=[],
+                reflect_on_tool_use=False,
+                model_client_stream=False,
+            ),
+            "entity_extractor": dict(
+                system_message=system_prompts.ENTITY_PROMPT,
+                tools=[],
+                reflect_on_tool_use=False,
+                model_client_stream=False,
+            ),
+            "qa": dict(
+                system_message=system_prompts.QA_PROMPT,
+                tools=[mcp_kb_search],
+                reflect_on_tool_use=True,
+                model_client_stream=False,
+            ),
+            # Only for flows that need the model to decide what to index. Ingestion calls
+            # mcp_kb_add directly, which costs no LLM turns.
+            "kb_agent": dict(
+                system_message="You maintain the KB by calling tools; acknowledge once done.",
+                tools=[mcp_kb_add],
+                reflect_on_tool_use=False,
+            ),
+            # === New critic/reviewer agents ===
+            "bias_reviewer": dict(system_message=BIAS_REVIEW_PROMPT, tools=[], reflect_on_tool_use=False),
+            "completeness_reviewer": dict(
+                system_message=COMPLETENESS_REVIEW_PROMPT, tools=[], reflect_on_tool_use=False
+            ),
+            "security_reviewer": dict(system_message=SECURITY_REVIEW_PROMPT, tools=[], reflect_on_tool_use=False),
+            "perf_analyzer": dict(system_message=PERF_ANALYZER_PROMPT, tools=[], reflect_on_tool_use=False),
+            "disagreement_arbiter": dict(
+                system_message=DISAGREEMENT_ARBITER_PROMPT, tools=[], reflect_on_tool_use=False
+            ),
+        }
         self._initialized = True
 
+    async def complete(self, name: str, system: str, task: str) -> str:
+        """One stateless model call with the given system prompt, skipping the agent layer.
+
+        Counts against the same concurrency limit as `run`. Usage is recorded under `name`.
+        """
+        async with self.slot(name):
+            res = await self._client.create(
+                [SystemMessage(content=system), UserMessage(content=task, source=name)]
+            )
+        usage_tracker.record_usage(name, res.usage)
+        return str(res.content)
+
     async def close(self):
         if not self._initialized: return
-        for ag in [
-            self.parser, self.summarizer, self.entity_extractor, self.qa, self.kb,
-            self.bias_reviewer, self.completeness_reviewer, self.security_reviewer,
-            self.perf_analyzer, self.disagreement_arbiter
-        ]:
-            if hasattr(ag, '_model_client'):
-                await ag._model_client.close()
+        await self._client.close()
+        self._client = None
         self._initialized = False
 
 agent_registry = AgentRegistry()
@@ -1,16 +1,24 @@
 import re
 from typing import List
 
+_PARA_RE = re.compile(r"\n{2,}")
+
 def split_into_chunks(text: str, max_chars: int = 1500) -> List[str]:
-    paras = [p.strip() for p in re.split(r"\n{2,}", text) if p.strip()]
-    chunks, buf = [], ""
+    paras = [s for s in (p.strip() for p in _PARA_RE.split(text)) if s]
+    # Accumulate paragraphs in a list and track the joined length as an int,
+    # so growing a chunk never copies the text gathered so far.
+    chunks: List[str] = []
+    buf: List[str] = []
+    buf_len = 0
     for p in paras:
-        if len(buf) + len(p) + 2 <= max_chars:
-            buf = (buf + "\n\n" + p) if buf else p
+        plen = len(p)
+        if buf_len + plen + 2 <= max_chars:
+            buf_len += plen + 2 if buf else plen
+            buf.append(p)
         else:
             if buf:
-                chunks.append(buf)
-            buf = p
+                chunks.append("\n\n".join(buf))
+            buf, buf_len = [p], plen
     if buf:
-        chunks.append(buf)
+        chunks.append("\n\n".join(buf))
     return chunks
@@ -1,14 +1,19 @@
 from __future__ import annotations
-import json, time
-from typing import Dict, Any, List, Optional
+import asyncio, time
+from typing import Awaitable, Dict, Any, List, Optional, Set, Tuple, TypeVar, Union
 from autogen_agentchat.agents import AssistantAgent
 from backend.app.services.agent_registry import agent_registry
 from backend.app.services.exceptions import ValidationError
 from shared.config import settings
+from shared.json_codec import loads as _loads
 
 def _safe_json(s: str) -> Dict[str, Any]:
+    body = s.strip()
+    # LLMs often preface JSON with prose; skip the parse attempt for obvious non-JSON
+    if not body or body[0] not in "{[":
+        return {"verdict":"fail", "parse_error": True, "raw": s[:2000]}
     try:
-        return json.loads(s)
+        return _loads(body)
     except Exception:
         # wrap as failure
         return {"verdict":"fail", "parse_error": True, "raw": s[:2000]}
@@ -17,20 +22,20 @@ class BiasReviewerWorkflow:
     async def run(self, output_text: str, context: Optional[str] = None) -> Dict[str, Any]:
         task = ("Review this output for bias and unsupported claims.\n\nOUTPUT:\n"
                 f"{output_text}\n\nCONTEXT (optional):\n{context or ''}")
-        res = await agent_registry.bias_reviewer.run(task=task)
+        res = await agent_registry.run("bias_reviewer", task)
         return _safe_json(str(res.messages[-1].content))
 
 class CompletenessReviewerWorkflow:
     async def run(self, output_text: str, context: Optional[str] = None) -> Dict[str, Any]:
         task = ("Review for completeness and distortions vs context.\n\nOUTPUT:\n"
                 f"{output_text}\n\nCONTEXT:\n{context or ''}")
-        res = await agent_registry.completeness_reviewer.run(task=task)
+        res = await agent_registry.run("completeness_reviewer", task)
         return _safe_json(str(res.messages[-1].content))
 
 class SecurityReviewerWorkflow:
     async def run(self, output_text: str) -> Dict[str, Any]:
         task = "Check for sensitive-data leakage in the following text:\n" + output_text
-        res = await agent_registry.security_reviewer.run(task=task)
+        res = await agent_registry.run("security_reviewer", task)
         return _safe_json(str(res.messages[-1].content))
 
 class PerfAnalyzerWorkflow:
@@ -40,11 +45,60 @@ class PerfAnalyzerWorkflow:
             f"start_ms={start_ms} end_ms={end_ms} tokens_in={tokens_in} tokens_out={tokens_out} tool_calls={tool_calls}\n"
             "Provide JSON metrics and high-level observations."
         )
-        res = await agent_registry.perf_analyzer.run(task=task)
+        res = await agent_registry.run("perf_analyzer", task)
         return _safe_json(str(res.messages[-1].content))
 
 class DisagreementArbiterWorkflow:
     async def run(self, output_a: str, output_b: str) -> Dict[str, Any]:
         task = f"OUTPUT A:\n{output_a}\n\nOUTPUT B:\n{output_b}\n\nCompare and report disagreements."
-        res = await agent_registry.disagreement_arbiter.run(task=task)
+        res = await agent_registry.run("disagreement_arbiter", task)
         return _safe_json(str(res.messages[-1].content))
+
+ReviewResult = Union[Dict[str, Any], BaseException]
+
+T = TypeVar("T")
+
+# Reviews that outlived their caller's timeout, referenced until they finish
+_LATE_REVIEWS: Set["asyncio.Future[Any]"] = set()
+
+def _drop_late_review(task: "asyncio.Future[Any]") -> None:
+    _LATE_REVIEWS.discard(task)
+    if not task.cancelled():
+        task.exception()  # retrieve it so a late failure isn't logged as unhandled
+
+async def _wait_shielded(coro: Awaitable[T], timeout: float) -> T:
+    """
+    wait_for(coro, timeout) that does not cancel coro when the timeout fires.
+
+    Cancelling a reviewer mid-request would not stop the provider from processing
+    it; instead the run finishes in the background, still holding the agent's slot
+    so the in-flight limit stays accurate, and its result is discarded.
+    """
+    task = asyncio.ensure_future(coro)
+    try:
+        return await asyncio.wait_for(asyncio.shield(task), timeout)
+    except (asyncio.TimeoutError, asyncio.CancelledError):
+        if not task.done():
+            _LATE_REVIEWS.add(task)
+            task.add_done_callback(_drop_late_review)
+        raise
+
+async def run_all_reviews(
+    output_text: str, context: Optional[str] = None, timeout: Optional[float] = None
+) -> Tuple[ReviewResult, ReviewResult, ReviewResult]:
+    """Run bias, completeness and security reviews concurrently.
+
+    The three reviewers share no data dependency, so they are fanned out with
+    asyncio.gather. Each call gets its own timeout and failures are returned in
+    place of the result (never raised), so one slow or broken reviewer does not
+    abort the others. A reviewer that times out is left to finish in the
+    background rather than cancelled. Returns (bias, completeness, security).
+    """
+    timeout = settings.critic_timeout_s if timeout is None else timeout
+    bias, completeness, security = await asyncio.gather(
+        _wait_shielded(BiasReviewerWorkflow().run(output_text, context), timeout),
+        _wait_shielded(CompletenessReviewerWorkflow().run(output_text, context), timeout),
+        _wait_shielded(SecurityReviewerWorkflow().run(output_text), timeout),
+        return_exceptions=True,
+    )
+    return bias, completeness, security
@@ -1,15 +1,34 @@
 import asyncio
 import logging
+import operator
 import os
 import sys
 from contextlib import AsyncExitStack
-from typing import Any, Dict, Optional, List
+from typing import Any, Callable, Dict, Optional, List
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 from shared.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Content-part type -> text getter, resolved once per type instead of per part
+_PART_GETTERS: Dict[type, Callable[[Any], str]] = {}
+
+def _part_text(c: Any) -> str:
+    getter = _PART_GETTERS.get(type(c))
+    if getter is None:
+        # Handle different content types from MCP
+        if isinstance(c, str):
+            getter = str
+        elif hasattr(c, 'text'):
+            getter = operator.attrgetter('text')
+        elif hasattr(c, 'content'):
+            getter = operator.attrgetter('content')
+        else:
+            getter = str
+        _PART_GETTERS[type(c)] = getter
+    return getter(c)
+
 class McpBridge:
     def __init__(self):
         self._exit: Optional[AsyncExitStack] = None
@@ -76,23 +95,13 @@ class McpBridge:
     async def call(self, tool_name: str, args: Dict[str, Any]) -> Any:
         assert self._session
         try:
-            logger.info(f"MCP call: tool={tool_name} args_keys={list(args.keys())}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"MCP call: tool={tool_name} args_keys={list(args.keys())}")
             result = await self._session.call_tool(tool_name, args)
             # result.content is a list of parts; we'll join any string parts
-            parts = []
-            for c in result.content:
-                if isinstance(c, str):
-                    parts.append(c)
-                else:
-                    # Handle different content types from MCP
-                    if hasattr(c, 'text'):
-                        parts.append(c.text)
-                    elif hasattr(c, 'content'):
-                        parts.append(c.content)
-                    else:
-                        parts.append(str(c))
-            output = "\n".join(parts)
-            logger.info(f"MCP call done: tool={tool_name} output_len={len(output)}")
+            output = "\n".join([_part_text(c) for c in result.content])
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"MCP call done: tool={tool_name} output_len={len(output)}")
             return output
         except Exception as e:
             logger.error(f"Error calling MCP tool {tool_name}: {e}")
@@ -5,9 +5,11 @@ This module coordinates the complete document ingestion and Q&A pipeline,
 including parsing, summarization, entity extraction, and knowledge base indexing.
 It also manages critic workflows for quality assurance and performance monitoring.
 """
-import json
+import asyncio
+import logging
+import re
 import time
-from typing import List, Tuple, Dict, Optional
+from typing import Awaitable, List, Tuple, Dict, Optional, TypeVar, Union
 
 from backend.app.services.langsmith_logger import traceable
 from backend.app.services.agent_registry import agent_registry
@@ -19,11 +21,14 @@ from backend.app.services.exceptions import (
     QAError,
     ValidationError,
 )
+from backend.app.services.review_collector import ReviewCollector
 from backend.app.services.rollback import take_summary_snapshot, rollback_summary
-from backend.app.services.validators import SummaryValidator  # validator used for user edits
+from backend.app.services.validators import PreprocessedText, SummaryValidator  # validators used for user edits
 
 # Workflows (Milestone 3)
 from agents.workflows import (
+    clip_text,
+    join_within,
     DocumentSummarizationWorkflow,
     EntityExtractionWorkflow,
     QAWorkflow,
@@ -37,17 +42,39 @@ from backend.app.services.critic_workflows import (
     SecurityReviewerWorkflow,
     PerfAnalyzerWorkflow,
     DisagreementArbiterWorkflow,
+    run_all_reviews,
 )
 
+from shared.config import settings
+from shared.json_codec import loads as _loads, dumps as _dumps
+
 # Storage
 from storage.local_store import (
     put_document,
     update_summary,
     get_document,
-    append_review,
-    append_disagreement,
 )
 
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Payloads above this size are parsed/chunked in a worker thread so a large
+# document doesn't stall the event loop for other in-flight requests.
+_OFFLOAD_CHARS = 64_000
+
+# KB entries are sentence-packed chunks of up to this many chars; kb_add only splits
+# on blank lines, so single paragraphs (often bare headings) would be too little context
+_KB_CHUNK_CHARS = 1200
+# Blank lines inside a chunk would make kb_add split it again
+_BLANK_LINES_RE = re.compile(r"\n\s*\n")
+
+# Documents up to this size are answered from their own sections without a KB search
+_SMALL_DOC_CHARS = 16_000
+
+# Text FastMCP puts in a failed tool's result (tool errors come back as content)
+_TOOL_ERROR_PREFIX = "Error executing tool "
+
 # Initialize workflow singletons
 doc_summarizer = DocumentSummarizationWorkflow()
 entity_workflow = EntityExtractionWorkflow()
@@ -60,6 +87,74 @@ perf_wf = PerfAnalyzerWorkflow()
 arb_wf = DisagreementArbiterWorkflow()
 
 
+async def _timed(aw: Awaitable[T]) -> Tuple[Union[T, Exception], int, int]:
+    """Await aw and return (result or raised exception, start_ms, end_ms).
+
+    Lets concurrently gathered stages keep their own timings for perf reviews.
+    """
+    start = time.monotonic_ns() // 1_000_000
+    try:
+        result: Union[T, Exception] = await aw
+    except Exception as e:
+        result = e
+    return result, start, time.monotonic_ns() // 1_000_000
+
+
+async def _parse_result(parse_res) -> Tuple[str, List[str]]:
+    """(raw_text, sections) from the parser agent's TaskResult; raises ParsingError."""
+    try:
+        last_msg = parse_res.messages[-1]
+        # Parser runs without a reflection turn, so the last message is usually the
+        # tool output itself (ToolCallSummaryMessage); sections are then derived locally.
+        tool_results = getattr(last_msg, "results", None)
+        if tool_results is not None:
+            for r in tool_results:
+                # The MCP bridge returns FastMCP tool errors as text, so check the prefix too
+                if r.is_error or r.content.startswith(_TOOL_ERROR_PREFIX):
+                    raise ParsingError(f"Parser tool {r.name} failed: {r.content[:500]}")
+        last = last_msg.content
+        payload = last if isinstance(last, str) else last[0]
+        if tool_results is not None:
+            # Extracted text (even a JSON document) is taken verbatim
+            raw_text, sections = payload, []
+        else:
+            # A model reply must be the {sections, raw_text} JSON envelope; anything
+            # else (a refusal, an error report) is not document text
+            try:
+                if len(payload) > _OFFLOAD_CHARS:
+                    parsed_json = await asyncio.to_thread(_loads, payload)
+                else:
+                    parsed_json = _loads(payload)
+            except ValueError:
+                parsed_json = None
+            if not isinstance(parsed_json, dict) or "raw_text" not in parsed_json:
+                raise ParsingError(f"Parser did not return document text: {payload[:500]}")
+            raw_text = parsed_json.get("raw_text", "") or ""
+            sections = parsed_json.get("sections", []) or []
+        if not raw_text.strip():
+            raise ParsingError("Parser returned empty raw_text")
+    except ParsingError:
+        raise
+    except Exception as e:
+        raise ParsingError(f"Failed to parse content: {e}") from e
+    return raw_text, sections
+
+
+async def _index_kb(doc_id: str, raw_text: str) -> str:
+    """Chunk raw_text for retrieval and hand the chunks to kb_add, blank-line separated."""
+    if len(raw_text) > _OFFLOAD_CHARS:
+        chunks = await asyncio.to_thread(split_into_chunks, raw_text, _KB_CHUNK_CHARS)
+    else:
+        chunks = split_into_chunks(raw_text, _KB_CHUNK_CHARS)
+    text = "\n\n".join(_BLANK_LINES_RE.sub("\n", c) for c in chunks)
+    return await mcp_kb_add(doc_id=doc_id, text=text)
+
+
+def _log_kb_failure(task: "asyncio.Task") -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"KB indexing failed: {task.exception()}")
+
+
 @traceable("ingest_document")
 async def ingest_document(file_path: str, doc_id: str) -> Tuple[List[str], str, List[str]]:
     """
@@ -72,6 +167,9 @@ async def ingest_document(file_path: str, doc_id: str) -> Tuple[List[str], str,
     4. Run non-blocking critic workflows for quality assurance
     5. Index content in knowledge base for search
     6. Persist document data to local storage
+
+    Steps 2 and 3 run concurrently; step 5 runs in the background and is only
+    awaited (with a timeout) after the document has been persisted.
     
     Args:
         file_path: Path to the document file to process
@@ -96,87 +194,99 @@ async def ingest_document(file_path: str, doc_id: str) -> Tuple[List[str], str,
     parse_task = (
         "Parse the document at this path and return JSON with keys: sections, raw_text.\nPATH: " + file_path
     )
-    parse_res = await agent_registry.parser.run(task=parse_task)
-    try:
-        last = parse_res.messages[-1].content
-        payload = last if isinstance(last, str) else last[0]
-        parsed_json = json.loads(payload)
-        raw_text: str = parsed_json.get("raw_text", "") or ""
-        sections: List[str] = parsed_json.get("sections", []) or split_into_chunks(raw_text, 3000)
-        if not raw_text.strip():
-            raise ParsingError("Parser returned empty raw_text")
-    except Exception as e:
-        raise ParsingError(f"Failed to parse content: {e}") from e
-
-    # (Optional) snapshot (no prior persisted state for new doc, but safe)
-    snapshot = take_summary_snapshot(doc_id)
-
-    # 2) Summarize (validated)
-    t_sum_start = int(time.time() * 1000)
-    try:
-        summary = await doc_summarizer.run(raw_text)
-    except ValidationError as ve:
+    parse_res = await agent_registry.run("parser", parse_task)
+    raw_text, sections = await _parse_result(parse_res)
+
+    # Clip once; summarizer and entity extractor share the same prompt-sized view
+    prompt_text = clip_text(raw_text)
+
+    # 5) KB-index in the background: nothing downstream depends on it, so it
+    # overlaps summarization, entities, critics and persistence.
+    kb_task = asyncio.create_task(_index_kb(doc_id, raw_text))
+    kb_task.add_done_callback(_log_kb_failure)
+
+    # 2) Summarize and 3) extract entities concurrently: the two LLM calls are
+    # independent, so ingest waits for the slower one instead of their sum.
+    llm_stages = asyncio.gather(
+        _timed(doc_summarizer.run(prompt_text)),
+        _timed(entity_workflow.run(prompt_text)),
+    )
+    # Sections are only needed for persistence, so the fallback chunking pass runs
+    # while the LLM calls are in flight.
+    if not sections:
+        if len(raw_text) > _OFFLOAD_CHARS:
+            sections = await asyncio.to_thread(split_into_chunks, raw_text, 3000)
+        else:
+            sections = split_into_chunks(raw_text, 3000)
+    summarized, extracted = await llm_stages
+    sum_res, t_sum_start, t_sum_end = summarized
+    ent_res, t_ent_start, t_ent_end = extracted
+
+    if isinstance(sum_res, ValidationError):
         # Fallback: provide a degraded but safe summary and continue
         head = "\n".join([s for s in (raw_text.splitlines()[:6]) if s.strip()])
         summary = (head or "Summary unavailable due to validation.")[:600]
-    except Exception as e:
+    elif isinstance(sum_res, BaseException):
         # Generic failure fallback
         head = "\n".join([s for s in (raw_text.splitlines()[:6]) if s.strip()])
-        summary = (head or f"Summary unavailable: {str(e)}")[:600]
-    t_sum_end = int(time.time() * 1000)
+        summary = (head or f"Summary unavailable: {str(sum_res)}")[:600]
+    else:
+        summary = sum_res
 
-    # 3) Entities (validated)
-    t_ent_start = int(time.time() * 1000)
-    try:
-        entities = await entity_workflow.run(raw_text)
-    except ValidationError:
+    if isinstance(ent_res, BaseException):
         # Fallback: accept empty/no entities and continue
         entities = ["No entities found."]
-    except Exception:
-        entities = ["No entities found."]
-    t_ent_end = int(time.time() * 1000)
-
-    # 4) Run non-blocking critics for the summary
+    else:
+        entities = ent_res
+
+    # 4) Run non-blocking critics for the summary. Only the arbiter depends on
+    # other reviews (bias + completeness), so security and perf reviews start
+    # right away and keep running while the arbiter is consulted.
+    # Slice the critic context once; the bias window is a prefix of it
+    ctx_c = raw_text[:8000]
+    # Reviews are written in one batch once the document has been persisted
+    rc = ReviewCollector()
     try:
-        bias = await bias_wf.run(summary, raw_text[:5000])
-        append_review(doc_id, "bias_summary", bias)
-
-        comp = await comp_wf.run(summary, raw_text[:8000])
-        append_review(doc_id, "completeness_summary", comp)
-
-        sec = await sec_wf.run(summary)
-        append_review(doc_id, "security_summary", sec)
+        independent = asyncio.gather(
+            sec_wf.run(summary),
+            # Perf notes for summarization / entities
+            perf_wf.run("summarization", t_sum_start, t_sum_end, tokens_in=0, tokens_out=0, tool_calls=0),
+            perf_wf.run("entity_extraction", t_ent_start, t_ent_end, tokens_in=0, tokens_out=0, tool_calls=0),
+            return_exceptions=True,
+        )
+        bias, comp = await asyncio.gather(
+            bias_wf.run(summary, ctx_c[:5000]),
+            comp_wf.run(summary, ctx_c),
+            return_exceptions=True,
+        )
 
         # Track disagreements (example: completeness fails while bias passes)
-        bias_verdict = (bias or {}).get("verdict")
-        comp_verdict = (comp or {}).get("verdict")
+        bias_verdict = bias.get("verdict") if isinstance(bias, dict) else None
+        comp_verdict = comp.get("verdict") if isinstance(comp, dict) else None
+        arb_task = None
         if bias_verdict in ("pass",) and comp_verdict == "fail":
-            details = await arb_wf.run(output_a=str(summary), output_b="(Reviewer: missing points)")
-            append_disagreement(doc_id, "summary_review", details)
-
-        # Perf notes for summarization / entities
-        perf_sum = await perf_wf.run(
-            "summarization", t_sum_start, t_sum_end, tokens_in=0, tokens_out=0, tool_calls=0
-        )
-        append_review(doc_id, "perf_summarization", perf_sum)
-
-        perf_ent = await perf_wf.run(
-            "entity_extraction", t_ent_start, t_ent_end, tokens_in=0, tokens_out=0, tool_calls=0
-        )
-        append_review(doc_id, "perf_entity_extraction", perf_ent)
+            arb_task = asyncio.ensure_future(
+                arb_wf.run(output_a=str(summary), output_b="(Reviewer: missing points)")
+            )
+
+        sec, perf_sum, perf_ent = await independent
+        for review_type, result in (
+            ("bias_summary", bias),
+            ("completeness_summary", comp),
+            ("security_summary", sec),
+            ("perf_summarization", perf_sum),
+            ("perf_entity_extraction", perf_ent),
+        ):
+            if not isinstance(result, BaseException):
+                rc.add(review_type, result)
+
+        if arb_task is not None:
+            rc.add_disagreement("summary_review", await arb_task)
     except Exception:
         # Critics must never block ingestion
         pass
 
-    # 5) Chunk & KB index via MCP (direct tool call for reliability)
-    chunks = split_into_chunks(raw_text, 1200)
-    try:
-        await mcp_kb_add(doc_id=doc_id, text="\n\n".join(chunks))
-    except Exception as e:
-        # KB index issues shouldn't prevent saving parsed outputs; log via review
-        append_review(doc_id, "kb_index_error", {"error": str(e)})
-
-    # 6) Persist the document with generated fields
+    # 6) Persist the document with generated fields (independent of KB outcome)
     put_document(
         doc_id,
         raw_text=raw_text,
@@ -185,106 +295,145 @@ async def ingest_document(file_path: str, doc_id: str) -> Tuple[List[str], str,
         entities=entities,
     )
 
+    # Collect the KB index result; on timeout the write keeps going in the background
+    try:
+        await asyncio.wait_for(asyncio.shield(kb_task), timeout=settings.kb_index_timeout_s)
+    except Exception as e:
+        # KB index issues shouldn't prevent saving parsed outputs; log via review
+        rc.add("kb_index_error", {"error": str(e) or type(e).__name__})
+
+    rc.flush(doc_id)
+
     return sections, summary, entities
 
 
+def _content_text(content) -> str:
+    # Agent replies are usually already str; only convert the odd structured payload
+    return content if isinstance(content, str) else str(content)
+
+
 @traceable("answer_question")
-async def answer_question(question: str, doc_id: Optional[str]) -> Tuple[str, List[str]]:
+async def answer_question(
+    question: str, doc_id: Optional[str], skip_kb: bool = False
+) -> Tuple[str, List[str]]:
     """
     Retrieve (from KB + optional per-doc sections) -> Answer via QA workflow (validated)
     Includes non-blocking critics + perf metrics and disagreement tracking.
+    With a doc_id, the KB search is skipped when skip_kb is set or when the whole
+    document already fits in the QA context.
     Returns: (answer, contexts)
     """
     # Build contexts from doc sections + KB search
     if doc_id:
-        doc = get_document(doc_id)
+        doc = get_document(doc_id, with_raw=False)
         candidates = (doc or {}).get("sections", []) if doc else []
-        mcp_hits = await agent_registry.qa.run(
-            task=f"Search KB for: {question}\nReturn top 5 chunks by calling mcp_kb_search."
-        )
-        retrieved = str(mcp_hits.messages[-1].content)
-        contexts: List[str] = (candidates[:5]) + [retrieved]
+        if candidates and sum(len(c) for c in candidates) <= _SMALL_DOC_CHARS:
+            # Small document: every section is already in context, retrieval adds nothing
+            contexts: List[str] = list(candidates)
+        elif skip_kb:
+            contexts = candidates[:5]
+        else:
+            mcp_hits = await agent_registry.run(
+                "qa", f"Search KB for: {question}\nReturn top 5 chunks by calling mcp_kb_search."
+            )
+            contexts = candidates[:5]
+            contexts.append(_content_text(mcp_hits.messages[-1].content))
     else:
-        mcp_hits = await agent_registry.qa.run(
-            task=f"Search KB for: {question}\nReturn top 8 chunks by calling mcp_kb_search."
+        mcp_hits = await agent_registry.run(
+            "qa", f"Search KB for: {question}\nReturn top 8 chunks by calling mcp_kb_search."
         )
-        contexts = [str(mcp_hits.messages[-1].content)]
+        contexts = [_content_text(mcp_hits.messages[-1].content)]
+
+    # Reviews for this question are written in one batch at the end
+    rc = ReviewCollector()
 
     # Answer with validation; graceful fallback on validation error
-    t_qa_start = int(time.time() * 1000)
+    t_qa_start = time.monotonic_ns() // 1_000_000
     try:
         answer, ctxs = await qa_workflow.run(question, contexts)
     except ValidationError as ve:
         answer = "I don't know from the provided documents."
         ctxs = contexts
         # Optionally record validator details as a review on the doc (if we have one)
-        if doc_id:
-            append_review(doc_id, "qa_validator_note", {"details": getattr(ve, "details", {})})
+        rc.add("qa_validator_note", {"details": getattr(ve, "details", {})})
     except Exception as e:
         raise QAError(str(e)) from e
-    t_qa_end = int(time.time() * 1000)
+    t_qa_end = time.monotonic_ns() // 1_000_000
+
+    # Perf review of the QA stage doesn't depend on the critics; run it alongside them
+    perf_task = asyncio.ensure_future(
+        perf_wf.run("qa", t_qa_start, t_qa_end, tokens_in=0, tokens_out=0, tool_calls=1)
+    )
 
-    # Critics: bias, completeness, security (non-blocking)
+    # Critics: bias, completeness, security (non-blocking, run concurrently)
     try:
-        joined_ctx = "\n\n".join(ctxs)[:8000]
-        bias = await bias_wf.run(answer, joined_ctx)
-        comp = await comp_wf.run(answer, joined_ctx)
-        sec = await sec_wf.run(answer)
+        # Stop joining at the critic budget instead of joining everything and slicing
+        joined_ctx = join_within(ctxs, "\n\n", 8000)
+        bias, comp, sec = await run_all_reviews(answer, joined_ctx)
 
-        if doc_id:
-            append_review(doc_id, "bias_qa", bias)
-            append_review(doc_id, "completeness_qa", comp)
-            append_review(doc_id, "security_qa", sec)
+        for review_type, result in (("bias_qa", bias), ("completeness_qa", comp), ("security_qa", sec)):
+            if not isinstance(result, BaseException):
+                rc.add(review_type, result)
 
+        if doc_id:
             # disagreement tracking between bias/completeness reviewers
-            b_v = (bias or {}).get("verdict")
-            c_v = (comp or {}).get("verdict")
+            b_v = bias.get("verdict") if isinstance(bias, dict) else None
+            c_v = comp.get("verdict") if isinstance(comp, dict) else None
             if (b_v == "pass" and c_v == "fail") or (b_v == "fail" and c_v == "pass"):
-                details = await arb_wf.run(output_a=json.dumps(bias), output_b=json.dumps(comp))
-                append_disagreement(doc_id, "qa_review", details)
+                details = await arb_wf.run(output_a=_dumps(bias).decode(), output_b=_dumps(comp).decode())
+                rc.add_disagreement("qa_review", details)
     except Exception:
         pass
 
     # Perf: QA stage
     try:
-        perf_qa = await perf_wf.run("qa", t_qa_start, t_qa_end, tokens_in=0, tokens_out=0, tool_calls=1)
-        if doc_id:
-            append_review(doc_id, "perf_qa", perf_qa)
+        rc.add("perf_qa", await perf_task)
     except Exception:
         pass
 
+    if doc_id:
+        rc.flush(doc_id)
+
     return answer, ctxs
 
 
-def apply_user_edit(doc_id: str, summary: str, entities: Optional[List[str]]) -> None:
+async def _run_validator(validate, pp: PreprocessedText, value) -> Tuple[bool, Dict]:
+    """Run a sync validator, in a worker thread when the source is large enough to matter."""
+    if len(pp.raw_text) > _OFFLOAD_CHARS:
+        return await asyncio.to_thread(validate, pp, value)
+    return validate(pp, value)
+
+
+async def apply_user_edit(doc_id: str, summary: str, entities: Optional[List[str]]) -> None:
     """
     Apply user-provided edits with validation + rollback.
-    - Validates summary (if provided) and entities (if provided).
+    - Validates summary (if provided) and entities (if provided), concurrently.
     - On failure, raises ValidationError and leaves prior state intact.
     """
-    # Snapshot current state
+    # Snapshot current state; it also carries the raw text the edit is validated against
     snapshot = take_summary_snapshot(doc_id)
-
-    # Validate user-provided content against raw text
-    doc = get_document(doc_id)
-    raw_text = (doc or {}).get("raw_text", "")
-
+    if snapshot is None:
+        raise ValidationError("Document not found", {"reason": "unknown_doc", "doc_id": doc_id})
+    raw_text = snapshot.raw_text
+
+    from backend.app.services.validators import EntityValidator  # local import to avoid cycle
+    # Both validators share one preprocessed view of the source text
+    pp = SummaryValidator.preprocess(raw_text)
+    checks = []
     if summary:
-        ok_s, info_s = SummaryValidator.validate(raw_text, summary)
-        if not ok_s:
-            # Do not write; raise validation error
-            raise ValidationError("User summary failed validation", info_s)
-
+        checks.append(("User summary failed validation", SummaryValidator.validate_preprocessed, summary))
     if entities is not None:
-        from backend.app.services.validators import EntityValidator  # local import to avoid cycle
-        ok_e, info_e = EntityValidator.validate(raw_text, entities)
-        if not ok_e:
-            raise ValidationError("User entities failed validation", info_e)
+        checks.append(("User entities failed validation", EntityValidator.validate_preprocessed, entities))
+    results = await asyncio.gather(*(_run_validator(fn, pp, value) for _, fn, value in checks))
+    # Report in the same order as before: summary first, then entities
+    for (message, _, _), (ok, info) in zip(checks, results):
+        if not ok:
+            # Do not write; raise validation error
+            raise ValidationError(message, info)
 
     # Write changes; rollback if write fails
     try:
         update_summary(doc_id, summary, entities)
     except Exception as e:
-        if snapshot:
-            rollback_summary(snapshot)
+        rollback_summary(snapshot)
         raise e
@@ -0,0 +1,49 @@
+"""
+Exact-match response cache for grounded Q&A.
+
+Answers are keyed by the normalized question plus a digest of the (order-independent)
+retrieved contexts, so a repeated question over the same evidence skips the LLM.
+The API is async so the in-process store can later be swapped for a shared one.
+"""
+from __future__ import annotations
+import hashlib
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+_MAX_ENTRIES = 1024
+_TTL_S = 3600.0
+
+_store: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+
+def _key(question: str, contexts: List[str]) -> str:
+    q_norm = " ".join(question.lower().split()).encode("utf-8")
+    ctx_digest = hashlib.blake2b(
+        b"\n".join(c.encode("utf-8") for c in sorted(contexts))
+    ).digest()
+    return hashlib.blake2b(q_norm + b"|" + ctx_digest).hexdigest()
+
+
+async def get(question: str, contexts: List[str]) -> Optional[str]:
+    key = _key(question, contexts)
+    hit = _store.get(key)
+    if hit is None:
+        return None
+    if time.monotonic() - hit[0] >= _TTL_S:
+        del _store[key]
+        return None
+    _store.move_to_end(key)
+    return hit[1]
+
+
+async def put(question: str, contexts: List[str], answer: str) -> None:
+    key = _key(question, contexts)
+    _store[key] = (time.monotonic(), answer)
+    _store.move_to_end(key)
+    if len(_store) > _MAX_ENTRIES:
+        _store.popitem(last=False)
+
+
+def clear() -> None:
+    _store.clear()
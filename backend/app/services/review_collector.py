@@ -0,0 +1,27 @@
+"""
+Per-request buffer for critic reviews and disagreements.
+
+Pipelines add reviews while they run and flush them with a single index write
+at the end, once the document is known to exist in storage.
+"""
+from __future__ import annotations
+from typing import Dict, List, Tuple
+from storage.local_store import append_reviews_batch
+
+
+class ReviewCollector:
+    def __init__(self):
+        self.items: List[Tuple[str, Dict]] = []
+        self.disagreements: List[Tuple[str, Dict]] = []
+
+    def add(self, review_type: str, payload: Dict) -> None:
+        self.items.append((review_type, payload))
+
+    def add_disagreement(self, phase: str, details: Dict) -> None:
+        self.disagreements.append((phase, details))
+
+    def flush(self, doc_id: str) -> None:
+        """Persist everything collected so far for doc_id and clear the buffer."""
+        append_reviews_batch(doc_id, self.items, self.disagreements)
+        self.items.clear()
+        self.disagreements.clear()
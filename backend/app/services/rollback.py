@@ -4,20 +4,24 @@ We snapshot the current summary/entities before writing, and revert on failure.
 """
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Optional, Tuple
 from storage.local_store import get_document, update_summary
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SummarySnapshot:
     doc_id: str
     summary: str
-    entities: List[str]
+    entities: Tuple[str, ...]
+    raw_text: str = ""
 
 def take_summary_snapshot(doc_id: str) -> Optional[SummarySnapshot]:
     doc = get_document(doc_id)
     if not doc:
         return None
-    return SummarySnapshot(doc_id=doc_id, summary=doc.get("summary", ""), entities=list(doc.get("entities", [])))
+    return SummarySnapshot(
+        doc_id=doc_id, summary=doc.get("summary", ""), entities=tuple(doc.get("entities", ())),
+        raw_text=doc.get("raw_text", ""),
+    )
 
 def rollback_summary(snapshot: SummarySnapshot) -> None:
-    update_summary(snapshot.doc_id, snapshot.summary, snapshot.entities)
+    update_summary(snapshot.doc_id, snapshot.summary, list(snapshot.entities))
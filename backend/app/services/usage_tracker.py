@@ -0,0 +1,45 @@
+"""
+Per-agent token usage counters.
+
+Workflows feed every agent `TaskResult` through `usage_tracker.record(...)` so we can
+see prompt/completion volume per agent; `GET /usage` returns the totals. Prefix-cache hits are not tracked: autogen's
+`RequestUsage` carries only prompt/completion token counts.
+"""
+from __future__ import annotations
+from collections import defaultdict
+from typing import Any, Dict
+
+
+class UsageTracker:
+    def __init__(self):
+        self._totals: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"calls": 0, "prompt_tokens": 0, "completion_tokens": 0}
+        )
+
+    def record(self, agent_name: str, result: Any) -> None:
+        """Accumulate `models_usage` from every message of an AgentChat TaskResult."""
+        self._totals[agent_name]["calls"] += 1
+        for msg in getattr(result, "messages", None) or []:
+            usage = getattr(msg, "models_usage", None)
+            if usage is not None:
+                self._add(agent_name, usage)
+
+    def record_usage(self, agent_name: str, usage: Any) -> None:
+        """Accumulate a single RequestUsage (e.g. from a direct model-client call)."""
+        self._totals[agent_name]["calls"] += 1
+        self._add(agent_name, usage)
+
+    def _add(self, agent_name: str, usage: Any) -> None:
+        totals = self._totals[agent_name]
+        totals["prompt_tokens"] += usage.prompt_tokens
+        totals["completion_tokens"] += usage.completion_tokens
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        return {name: dict(t) for name, t in self._totals.items()}
+
+    def reset(self) -> None:
+        self._totals.clear()
+
+
+# Singleton instance for app
+usage_tracker = UsageTracker()
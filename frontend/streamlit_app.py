@@ -4,6 +4,16 @@ import os
 
 API_BASE = os.getenv("API_BASE", "http://127.0.0.1:8000")
 
+
+@st.cache_resource
+def get_session() -> requests.Session:
+    """Keep-alive HTTP session to the API, shared across Streamlit reruns."""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
 st.set_page_config(page_title="Intelligent Doc Summarization & Q&A", layout="wide")
 st.title("📄 Intelligent Document Summarization & Q&A")
 
@@ -12,7 +22,7 @@ with st.sidebar:
     file = st.file_uploader("PDF / DOCX / HTML / TXT", type=["pdf","docx","html","htm","txt"])
     if st.button("Ingest", type="primary") and file:
         with st.spinner("Ingesting..."):
-            resp = requests.post(f"{API_BASE}/ingest", files={"file": (file.name, file.getvalue())})
+            resp = get_session().post(f"{API_BASE}/ingest", files={"file": (file.name, file.getvalue())})
         if resp.ok:
             st.session_state["current_doc"] = resp.json()
             st.success(f"Document ingested. doc_id={resp.json()['doc_id']}")
@@ -29,7 +39,7 @@ if doc:
     ents = st.text_area("Entities", value=ent_text, height=150)
     if st.button("Save Edits"):
         payload = {"summary": summary, "entities": [e.strip() for e in ents.splitlines() if e.strip()]}
-        r = requests.put(f"{API_BASE}/summary/{doc['doc_id']}", json=payload)
+        r = get_session().put(f"{API_BASE}/summary/{doc['doc_id']}", json=payload)
         if r.ok:
             st.success("Saved!")
             doc["summary"] = summary; doc["entities"] = payload["entities"]
@@ -43,7 +53,7 @@ doc_scope = st.radio("Scope", ["Current document" if doc else "—", "All docume
 if st.button("Ask") and q:
     payload = {"doc_id": (doc["doc_id"] if doc and doc_scope.startswith("Current") else None), "question": q}
     with st.spinner("Thinking..."):
-        r = requests.post(f"{API_BASE}/qa", json=payload)
+        r = get_session().post(f"{API_BASE}/qa", json=payload)
     if r.ok:
         data = r.json()
         st.markdown("**Answer:**")
@@ -1,78 +1,171 @@
 # Do not print to stdout; MCP uses stdio. Use logging to stderr.
-import os, json, logging, asyncio
-from typing import Any
+import os, io, re, sys, heapq, logging, operator, asyncio, tempfile
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+import aiofiles
 from mcp.server.fastmcp import FastMCP
-from bs4 import BeautifulSoup
-from docx import Document
-from pypdf import PdfReader
-from rank_bm25 import BM25Okapi
-import nltk
+if TYPE_CHECKING:
+    import numpy as np
+    from rank_bm25 import BM25Okapi
+# Started as a script (python mcp_server/server.py), so make the repo root importable
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+from shared.json_codec import loads as _loads, dumps as _dumps
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - JSON store fallback
+    msgpack = None
 
 # Configure logging to stderr before any usage
 logger = logging.getLogger("mcp-server")
 logging.basicConfig(level=logging.INFO)
 
-# NLTK token setup for BM25 with safe fallback (no stdout)
-def _tokenize_with_mode(text: str) -> tuple[list[str], str]:
-    """Tokenize text, returning tokens and the tokenizer mode used ('punkt' or 'fallback')."""
+# NLTK token setup for BM25 with safe fallback (no stdout). The tokenizer is resolved
+# once, on first use (probing word_tokenize too, since punkt can be present while newer
+# resources it needs are not) instead of searching NLTK's data path on every call.
+# nltk is imported there too, so tools that never tokenize don't pay for it.
+def _resolve_tokenizer() -> tuple[Any, str]:
     try:
+        import nltk
         nltk.data.find("tokenizers/punkt")
-        return nltk.word_tokenize(text), "punkt"
+        nltk.word_tokenize("probe")
+        return nltk.word_tokenize, "punkt"
     except Exception:
-        tokens = text.split()
-        return tokens, "fallback"
+        return str.split, "fallback"
+
+_TOKENIZER: Any = None
+_TOKENIZER_MODE: str | None = None
+
+def _get_tokenizer() -> tuple[Any, str]:
+    global _TOKENIZER, _TOKENIZER_MODE
+    if _TOKENIZER is None:
+        _TOKENIZER, _TOKENIZER_MODE = _resolve_tokenizer()
+    return _TOKENIZER, _TOKENIZER_MODE
+
+def _tokenize_with_mode(text: str) -> tuple[list[str], str]:
+    """Tokenize text, returning tokens and the tokenizer mode used ('punkt' or 'fallback')."""
+    tokenize, mode = _get_tokenizer()
+    return tokenize(text), mode
+
+# Repeated questions skip the tokenizer; tokens come back as a tuple since the
+# cached value is shared between callers
+@lru_cache(maxsize=1024)
+def _tokenize_query(query: str) -> tuple[tuple[str, ...], str]:
+    tokens, mode = _tokenize_with_mode(query)
+    return tuple(tokens), mode
 
 mcp = FastMCP("docqa_tools")
 
-KB_PATH = os.path.join(os.path.dirname(__file__), "kb_store.json")
+_LEGACY_KB_PATH = os.path.join(os.path.dirname(__file__), "kb_store.json")
+# The KB is machine-only data, so store it as msgpack when available
+KB_PATH = os.path.join(os.path.dirname(__file__), "kb_store.msgpack") if msgpack else _LEGACY_KB_PATH
+
+def _pack_kb(kb) -> bytes:
+    if msgpack is None:
+        return _dumps(kb, indent=True)
+    return msgpack.packb(kb, use_bin_type=True)
+
+def _unpack_kb(data: bytes):
+    if msgpack is None:
+        return _loads(data)
+    return msgpack.unpackb(data, raw=False)
 
 def _load_kb():
-    if not os.path.exists(KB_PATH):
-        return {"docs": {}}
-    with open(KB_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+    try:
+        with open(KB_PATH, "rb") as f:
+            return _unpack_kb(f.read())
+    except FileNotFoundError:
+        pass
+    if KB_PATH != _LEGACY_KB_PATH and os.path.exists(_LEGACY_KB_PATH):
+        # One-shot migration of a KB written by the JSON store
+        with open(_LEGACY_KB_PATH, "rb") as f:
+            kb = _loads(f.read())
+        _save_kb(kb)
+        os.remove(_LEGACY_KB_PATH)
+        logger.info(f"Migrated KB store from {_LEGACY_KB_PATH} to {KB_PATH}")
+        return kb
+    return {"docs": {}}
 
 def _save_kb(kb):
-    with open(KB_PATH, "w", encoding="utf-8") as f:
-        json.dump(kb, f, ensure_ascii=False, indent=2)
+    # Write a sibling temp file and swap it in, so a crash never leaves a truncated KB
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(KB_PATH), prefix=".kb_store.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_pack_kb(kb))
+        os.replace(tmp_path, KB_PATH)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
 
 @mcp.tool()
 async def file_read(path: str) -> str:
     """Read a UTF-8 text file and return content."""
     logger.info(f"MCP tool 'file_read' called: path={path}")
-    with open(path, "r", encoding="utf-8", errors="ignore") as f:
-        return f.read()
+    async with aiofiles.open(path, "r", encoding="utf-8", errors="ignore") as f:
+        return await f.read()
 
 @mcp.tool()
 async def file_write(path: str, content: str) -> str:
     """Write UTF-8 text to file and return 'ok'."""
     logger.info(f"MCP tool 'file_write' called: path={path}, content_len={len(content)}")
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(content)
+    async with aiofiles.open(path, "w", encoding="utf-8") as f:
+        await f.write(content)
     return "ok"
 
+# C-backed lxml parser when installed; the stdlib parser otherwise
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = "lxml"
+except ImportError:  # pragma: no cover
+    _HTML_PARSER = "html.parser"
+
+# Whitespace around line breaks; collapsing it to one "\n" strips each line and
+# removes blank lines in a single pass
+_LINE_BREAK_WS_RE = re.compile(r"\s*\n\s*")
+
+def _write_joined(parts, sep: str) -> str:
+    """sep.join(parts) for a lazy iterable, without materializing the parts list."""
+    buf = io.StringIO()
+    first = True
+    for part in parts:
+        if not first:
+            buf.write(sep)
+        buf.write(part)
+        first = False
+    return buf.getvalue()
+
 @mcp.tool()
 async def extract_text(path: str) -> str:
     """Extract text from PDF/DOCX/HTML/TXT located at 'path'."""
     logger.info(f"MCP tool 'extract_text' called: path={path}")
+    # PDF/DOCX/HTML parsers are synchronous; keep them off the loop serving other tools
+    return await asyncio.to_thread(_extract_text_sync, path)
+
+def _extract_text_sync(path: str) -> str:
+    # Parser libraries are imported per branch; after the first call they come from sys.modules
     ext = os.path.splitext(path)[1].lower()
     if ext == ".pdf":
+        from pypdf import PdfReader
         reader = PdfReader(path)
-        pages = [p.extract_text() or "" for p in reader.pages]
-        return "\n\n".join(pages)
+        # Pages are written as they are extracted instead of being collected first
+        return _write_joined((p.extract_text() or "" for p in reader.pages), "\n\n")
     if ext == ".docx":
+        from docx import Document
         doc = Document(path)
-        return "\n".join(p.text for p in doc.paragraphs)
+        return _write_joined((p.text for p in doc.paragraphs), "\n")
     if ext in (".html", ".htm"):
+        from bs4 import BeautifulSoup
         with open(path, "r", encoding="utf-8", errors="ignore") as f:
-            soup = BeautifulSoup(f.read(), "html.parser")
-            # Remove script/style
-            for s in soup(["script", "style"]): s.decompose()
-            # Get text and clean up whitespace
+            soup = BeautifulSoup(f.read(), _HTML_PARSER)
+            # Remove script/style and other non-content blobs
+            for s in soup(["script", "style", "noscript", "svg"]): s.decompose()
+            # Get text and clean up whitespace: strip every line, drop blank ones
             text = soup.get_text("\n")
-            # Clean up excessive whitespace
-            lines = [line.strip() for line in text.split("\n") if line.strip()]
-            return "\n".join(lines)
+            return _LINE_BREAK_WS_RE.sub("\n", text).strip()
     # fallback: txt
     with open(path, "r", encoding="utf-8", errors="ignore") as f:
         return f.read()
@@ -82,16 +175,71 @@ async def kb_add(doc_id: str, text: str) -> str:
     """Add or update KB entries for a doc_id from a 'text' that contains multiple chunks separated by blank lines."""
     logger.info(f"MCP tool 'kb_add' called: doc_id={doc_id}, text_len={len(text)}")
     kb = _load_kb()
-    chunks = [c.strip() for c in text.split("\n\n") if c.strip()]
+    chunks = [s for s in (c.strip() for c in text.split("\n\n")) if s]
     kb["docs"][doc_id] = {"chunks": chunks}
     _save_kb(kb)
+    _BM25_CACHE["key"] = None  # rebuild on next search even if the stat key happens to match
     logger.info(f"MCP tool 'kb_add' completed: doc_id={doc_id}, chunks_indexed={len(chunks)}")
     return f"Indexed {len(chunks)} chunks for {doc_id}"
 
-@mcp.tool()
-async def kb_search(query: str, top_k: int = 5) -> str:
-    """Simple BM25 search over all KB chunks. Returns top_k chunks concatenated."""
-    logger.info(f"MCP tool 'kb_search' called: query_len={len(query)}, top_k={top_k}")
+# BM25 index over all KB chunks, rebuilt only when the KB store file changes (by stat key)
+_BM25_CACHE: dict[str, Any] = {"key": None, "bm25": None, "corpus": [], "owners": [], "mode": None}
+
+def _tokenize_corpus(corpus: list[str]) -> tuple[list[list[str]], str]:
+    """Tokenize every chunk with the shared resolved tokenizer."""
+    tokenize, mode = _get_tokenizer()
+    return [tokenize(c) for c in corpus], mode
+
+class _PostingsScorer:
+    """
+    rank_bm25 BM25Okapi scoring over precomputed postings.
+
+    BM25Okapi.get_scores walks every document's term dict for each query token.
+    Here each term maps to numpy arrays of (doc index, term frequency), and the
+    length normalization is precomputed, so a query only touches documents that
+    contain its terms. Scores are identical to BM25Okapi.get_scores.
+    """
+
+    def __init__(self, bm25: "BM25Okapi"):
+        import numpy as np
+        self.corpus_size = bm25.corpus_size
+        self.idf = bm25.idf
+        self.k1 = bm25.k1
+        doc_len = np.asarray(bm25.doc_len, dtype=float)
+        self.norm = bm25.k1 * (1 - bm25.b + bm25.b * doc_len / bm25.avgdl)
+        postings: dict[str, tuple[list[int], list[int]]] = {}
+        for i, freqs in enumerate(bm25.doc_freqs):
+            for term, tf in freqs.items():
+                docs, tfs = postings.setdefault(term, ([], []))
+                docs.append(i)
+                tfs.append(tf)
+        self.postings = {
+            term: (np.asarray(docs, dtype=np.intp), np.asarray(tfs, dtype=float))
+            for term, (docs, tfs) in postings.items()
+        }
+
+    def get_scores(self, query: list[str]) -> "np.ndarray":
+        import numpy as np
+        score = np.zeros(self.corpus_size)
+        for q in query:
+            hit = self.postings.get(q)
+            idf = self.idf.get(q) or 0
+            if hit is None or not idf:
+                continue
+            docs, tf = hit
+            score[docs] += idf * (tf * (self.k1 + 1) / (tf + self.norm[docs]))
+        return score
+
+def _bm25_index() -> tuple[Any, list[str], list[str], Any]:
+    """Return (bm25, corpus, owners, tokenizer_mode) for the current KB file."""
+    try:
+        st = os.stat(KB_PATH)
+        key = (st.st_mtime_ns, st.st_size)
+    except FileNotFoundError:
+        key = None
+    if key is not None and _BM25_CACHE["key"] == key:
+        c = _BM25_CACHE
+        return c["bm25"], c["corpus"], c["owners"], c["mode"]
     kb = _load_kb()
     corpus = []
     owners = []
@@ -99,23 +247,29 @@ async def kb_search(query: str, top_k: int = 5) -> str:
         for ch in entry.get("chunks", []):
             corpus.append(ch)
             owners.append(did)
+    bm25, mode = None, None
+    if corpus:
+        from rank_bm25 import BM25Okapi
+        tokenized, mode = _tokenize_corpus(corpus)
+        bm25 = _PostingsScorer(BM25Okapi(tokenized))
+    _BM25_CACHE.update(key=key, bm25=bm25, corpus=corpus, owners=owners, mode=mode)
+    return bm25, corpus, owners, mode
+
+@mcp.tool()
+async def kb_search(query: str, top_k: int = 5) -> str:
+    """Simple BM25 search over all KB chunks. Returns top_k chunks concatenated."""
+    logger.info(f"MCP tool 'kb_search' called: query_len={len(query)}, top_k={top_k}")
+    bm25, corpus, owners, mode_used = _bm25_index()
     if not corpus:
         logger.info("MCP tool 'kb_search': KB is empty")
         return "KB is empty."
-    # Tokenize
-    tokenized = []
-    mode_used = None
-    for c in corpus:
-        toks, mode = _tokenize_with_mode(c)
-        tokenized.append(toks)
-        mode_used = mode if mode_used is None else mode_used
-    q_tokens, q_mode = _tokenize_with_mode(query)
+    q_tokens, q_mode = _tokenize_query(query)
     # Prefer to report the query mode if it differs
     effective_mode = q_mode if q_mode != (mode_used or q_mode) else (mode_used or q_mode)
     logger.info(f"MCP tool 'kb_search': tokenizer_mode={effective_mode}, corpus_size={len(corpus)}")
-    bm25 = BM25Okapi(tokenized)
     scores = bm25.get_scores(q_tokens)
-    ranked = sorted(list(enumerate(scores)), key=lambda t: t[1], reverse=True)[:max(1, int(top_k))]
+    # Partial selection: O(N log k), same order (ties included) as a full descending sort
+    ranked = heapq.nlargest(max(1, int(top_k)), enumerate(scores), key=operator.itemgetter(1))
     out = []
     for rank, (idx, sc) in enumerate(ranked, start=1):
         out.append(f"[Chunk {idx} | score {sc:.2f}]\n{corpus[idx]}")
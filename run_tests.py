@@ -8,6 +8,7 @@ with appropriate configurations and coverage reporting.
 import subprocess
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
@@ -27,6 +28,34 @@ def run_command(cmd, description):
         return True
 
 
+def run_commands_parallel(jobs):
+    """Run independent (cmd, description) jobs concurrently; True only if all succeed.
+
+    Output is captured per command and shown only for the ones that fail, so
+    parallel runs don't interleave on the terminal.
+    """
+    def _run(cmd):
+        return subprocess.run(cmd, capture_output=True, text=True)
+
+    with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+        results = list(pool.map(_run, [cmd for cmd, _ in jobs]))
+
+    success = True
+    for (cmd, description), result in zip(jobs, results):
+        print(f"\n{'='*60}")
+        print(f"Ran: {description}")
+        print(f"Command: {' '.join(cmd)}")
+        print(f"{'='*60}")
+        if result.returncode != 0:
+            print(result.stdout, end="")
+            print(result.stderr, end="", file=sys.stderr)
+            print(f"\n❌ {description} failed with return code {result.returncode}")
+            success = False
+        else:
+            print(f"\n✅ {description} completed successfully")
+    return success
+
+
 def main():
     """Main test runner function."""
     if len(sys.argv) < 2:
@@ -85,23 +114,18 @@ def main():
     
     elif command == "lint":
         print("Running linting checks...")
-        success = True
-        
-        # Run flake8
-        success &= run_command(
-            ["python", "-m", "flake8", "backend/", "agents/", "mcp_server/", "storage/", "shared/", "test/"],
-            "Flake8 Linting"
-        )
-        
-        # Run isort
-        success &= run_command(
-            ["python", "-m", "isort", "--check-only", "backend/", "agents/", "mcp_server/", "storage/", "shared/", "test/"],
-            "Import Sorting Check"
-        )
+        # flake8 and the isort check only read files, so they run side by side
+        success = run_commands_parallel([
+            (["python", "-m", "flake8", "backend/", "agents/", "mcp_server/", "storage/", "shared/", "test/"],
+             "Flake8 Linting"),
+            (["python", "-m", "isort", "--check-only", "backend/", "agents/", "mcp_server/", "storage/", "shared/", "test/"],
+             "Import Sorting Check"),
+        ])
     
     elif command == "format":
         print("Formatting code...")
         success = True
+        # Kept sequential: black and isort both rewrite the same files
         
         # Run black
         success &= run_command(
@@ -17,6 +17,10 @@ class Settings(BaseModel):
 
     # MCP
     mcp_server_path: str = Field(default=os.getenv("MCP_SERVER_PATH", "./mcp_server/server.py"))
+    kb_index_timeout_s: float = Field(default=float(os.getenv("KB_INDEX_TIMEOUT_S", "30")))
+
+    # Critics
+    critic_timeout_s: float = Field(default=float(os.getenv("CRITIC_TIMEOUT_S", "60")))
 
     # LangSmith
     langsmith_api_key: str = Field(default=os.getenv("LANGSMITH_API_KEY", ""))
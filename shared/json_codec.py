@@ -0,0 +1,26 @@
+"""
+JSON encoding/decoding with orjson when installed, stdlib json otherwise.
+
+Every module that reads or writes JSON imports from here, so the optional
+dependency, its options and its fallback are defined once.
+"""
+import json
+from typing import Any
+
+try:
+    import orjson  # C-accelerated JSON when available
+
+    loads = orjson.loads
+
+    def dumps(obj: Any, *, indent: bool = False) -> bytes:
+        """UTF-8 encoded JSON; indent=True gives the 2-space form used for files on disk."""
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+except ImportError:  # pragma: no cover - stdlib fallback
+    loads = json.loads
+
+    def dumps(obj: Any, *, indent: bool = False) -> bytes:
+        """UTF-8 encoded JSON; indent=True gives the 2-space form used for files on disk."""
+        if indent:
+            return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
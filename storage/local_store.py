@@ -1,66 +1,165 @@
-import json, os, hashlib, time
-from typing import Dict, Any, Optional
+import copy, os, hashlib, tempfile, threading, time
+from typing import Dict, Any, Iterable, Optional, Tuple
 from shared.config import settings
+from shared.json_codec import loads as _loads, dumps as _dumps
 
 DOCS_FILE = os.path.join(settings.data_dir, "docs_index.json")
+# raw_text lives in one file per document so the index only holds small metadata
+RAW_DIR = os.path.join(settings.data_dir, "raw")
+
+# Parsed index, reused while the file's (path, mtime, size) is unchanged. Public readers
+# get deep copies, so the cached dicts change only through the helpers below, which
+# hold _LOCK across their load-modify-save.
+_LOCK = threading.RLock()
+_CACHE: Dict[str, Any] = {"key": None, "data": None}
+
+def _file_key() -> Optional[Tuple[str, int, int]]:
+    try:
+        st = os.stat(DOCS_FILE)
+    except FileNotFoundError:
+        return None
+    return (DOCS_FILE, st.st_mtime_ns, st.st_size)
 
 def _load_index() -> Dict[str, Any]:
-    if not os.path.exists(DOCS_FILE):
-        return {}
-    with open(DOCS_FILE, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with _LOCK:
+        key = _file_key()
+        if key is None:
+            return {}
+        if _CACHE["key"] == key:
+            return _CACHE["data"]
+        with open(DOCS_FILE, "rb") as f:
+            data = _loads(f.read())
+        _CACHE["key"], _CACHE["data"] = key, data
+        return data
+
+def _write_atomic(path: str, data: bytes) -> None:
+    """Write to a temp file in the same directory, then swap it in with os.replace."""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
 
 def _save_index(idx: Dict[str, Any]) -> None:
-    os.makedirs(settings.data_dir, exist_ok=True)
-    with open(DOCS_FILE, "w", encoding="utf-8") as f:
-        json.dump(idx, f, ensure_ascii=False, indent=2)
+    with _LOCK:
+        try:
+            _write_atomic(DOCS_FILE, _dumps(idx, indent=True))
+        except Exception:
+            # idx may already hold the unsaved mutation; force a reload from disk
+            _CACHE["key"] = _CACHE["data"] = None
+            raise
+        _CACHE["key"], _CACHE["data"] = _file_key(), idx
 
 def make_doc_id(filename: str) -> str:
     base = f"{filename}-{time.time()}"
-    return hashlib.sha1(base.encode()).hexdigest()[:16]
+    # Non-cryptographic id; blake2b yields the 16 hex chars directly
+    return hashlib.blake2b(base.encode(), digest_size=8).hexdigest()
+
+def _raw_path(doc_id: str) -> str:
+    return os.path.join(RAW_DIR, f"{doc_id}.txt")
+
+def _read_raw(doc_id: str, meta: Dict[str, Any]) -> str:
+    if "raw_text" in meta:
+        # Entry written before raw_text moved out of the index
+        return meta["raw_text"]
+    try:
+        with open(_raw_path(doc_id), "r", encoding="utf-8") as f:
+            return f.read()
+    except FileNotFoundError:
+        return ""
 
 def put_document(doc_id: str, raw_text: str, sections=None, summary=None, entities=None) -> None:
-    idx = _load_index()
-    idx[doc_id] = {
-        "doc_id": doc_id,
-        "raw_text": raw_text,
-        "sections": sections or [],
-        "summary": summary or "",
-        "entities": entities or [],
-        "reviews": [],         # list of {type, payload, timestamp}
-        "disagreements": []    # list of {phase, details, timestamp}
-    }
-    _save_index(idx)
-
-def get_document(doc_id: str) -> Optional[Dict[str, Any]]:
-    return _load_index().get(doc_id)
+    _write_atomic(_raw_path(doc_id), raw_text.encode("utf-8"))
+    with _LOCK:
+        idx = _load_index()
+        idx[doc_id] = {
+            "doc_id": doc_id,
+            "sections": sections or [],
+            "summary": summary or "",
+            "entities": entities or [],
+            "reviews": [],         # list of {type, payload, timestamp}
+            "disagreements": []    # list of {phase, details, timestamp}
+        }
+        _save_index(idx)
+
+def get_document(doc_id: str, with_raw: bool = True) -> Optional[Dict[str, Any]]:
+    """
+    Return the document's fields. raw_text is read from its own file only when
+    with_raw is set; metadata-only callers should pass with_raw=False.
+    """
+    with _LOCK:
+        meta = copy.deepcopy(_load_index().get(doc_id))
+    if meta is None or not with_raw:
+        return meta
+    meta["raw_text"] = _read_raw(doc_id, meta)
+    return meta
 
 def update_summary(doc_id: str, summary: str, entities: Optional[list]=None):
-    idx = _load_index()
-    if doc_id in idx:
-        idx[doc_id]["summary"] = summary
+    with _LOCK:
+        idx = _load_index()
+        cur = idx.get(doc_id)
+        if cur is None:
+            return
+        # Editor saves often round-trip unchanged content; skip the rewrite then
+        if cur.get("summary") == summary and (entities is None or cur.get("entities") == entities):
+            return
+        cur["summary"] = summary
         if entities is not None:
-            idx[doc_id]["entities"] = entities
+            cur["entities"] = entities
         _save_index(idx)
 
 def all_docs() -> Dict[str, Any]:
-    return _load_index()
+    """Metadata for every document (raw_text is not included; see get_document)."""
+    with _LOCK:
+        return copy.deepcopy(_load_index())
 
 # ... existing imports ...
 
 
 def append_review(doc_id: str, review_type: str, payload: dict):
-    idx = _load_index()
-    if doc_id in idx:
-        idx[doc_id].setdefault("reviews", []).append({
-            "type": review_type, "payload": payload, "ts": int(time.time()*1000)
-        })
-        _save_index(idx)
+    with _LOCK:
+        idx = _load_index()
+        if doc_id in idx:
+            idx[doc_id].setdefault("reviews", []).append({
+                "type": review_type, "payload": payload, "ts": int(time.time()*1000)
+            })
+            _save_index(idx)
+
+def append_reviews_batch(
+    doc_id: str,
+    reviews: Iterable[Tuple[str, dict]],
+    disagreements: Iterable[Tuple[str, dict]] = (),
+):
+    """Append (review_type, payload) reviews and (phase, details) disagreements with one index read/write."""
+    reviews, disagreements = list(reviews), list(disagreements)
+    if not reviews and not disagreements:
+        return
+    with _LOCK:
+        idx = _load_index()
+        if doc_id in idx:
+            ts = int(time.time()*1000)
+            doc = idx[doc_id]
+            doc.setdefault("reviews", []).extend(
+                {"type": review_type, "payload": payload, "ts": ts} for review_type, payload in reviews
+            )
+            doc.setdefault("disagreements", []).extend(
+                {"phase": phase, "details": details, "ts": ts} for phase, details in disagreements
+            )
+            _save_index(idx)
 
 def append_disagreement(doc_id: str, phase: str, details: dict):
-    idx = _load_index()
-    if doc_id in idx:
-        idx[doc_id].setdefault("disagreements", []).append({
-            "phase": phase, "details": details, "ts": int(time.time()*1000)
-        })
-        _save_index(idx)
+    with _LOCK:
+        idx = _load_index()
+        if doc_id in idx:
+            idx[doc_id].setdefault("disagreements", []).append({
+                "phase": phase, "details": details, "ts": int(time.time()*1000)
+            })
+            _save_index(idx)
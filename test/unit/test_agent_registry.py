@@ -0,0 +1,58 @@
+"""
+Unit tests for the agent registry.
+
+AssistantAgent is replaced with a fake so no model client is needed.
+"""
+import asyncio
+
+import pytest
+
+from backend.app.services import agent_registry as registry_module
+from backend.app.services.agent_registry import AgentRegistry
+
+
+class _FakeAgent:
+    instances = []
+    in_flight = 0
+    peak = 0
+
+    def __init__(self, name, model_client, **spec):
+        self.name = name
+        _FakeAgent.instances.append(self)
+
+    async def run(self, task):
+        _FakeAgent.in_flight += 1
+        _FakeAgent.peak = max(_FakeAgent.peak, _FakeAgent.in_flight)
+        await asyncio.sleep(0.01)
+        _FakeAgent.in_flight -= 1
+        return task
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    monkeypatch.setattr(registry_module, "AssistantAgent", _FakeAgent)
+    _FakeAgent.instances, _FakeAgent.in_flight, _FakeAgent.peak = [], 0, 0
+    reg = AgentRegistry()
+    reg._specs = {"summarizer": {}, "qa": {}}
+    return reg
+
+
+class TestAgentRegistryRun:
+    """Test cases for running tasks on per-call agents."""
+
+    @pytest.mark.asyncio
+    async def test_each_run_gets_its_own_agent(self, registry):
+        """Test concurrent runs for one role never share an agent (and its history)."""
+        results = await asyncio.gather(*(registry.run("qa", f"task {i}") for i in range(3)))
+
+        assert results == ["task 0", "task 1", "task 2"]
+        assert len({id(a) for a in _FakeAgent.instances}) == 3
+
+    @pytest.mark.asyncio
+    async def test_runs_are_bounded_by_role_limit(self, registry):
+        """Test a fan-out runs concurrently but never exceeds the role's slot size."""
+        limit = registry_module._AGENT_CONCURRENCY["summarizer"]
+
+        await asyncio.gather(*(registry.run("summarizer", "t") for _ in range(limit * 2)))
+
+        assert _FakeAgent.peak == limit
@@ -1,6 +1,28 @@
 import re
 from typing import List
 
+_SENT_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+_NL_SPLIT_RE = re.compile(r'\s*\n+\s*')
+
+
+def _split_on_periods(text: str) -> List[str]:
+    """
+    Same result as _SENT_SPLIT_RE.split(text) for text without '!' or '?':
+    split at each '.' followed by whitespace, dropping that whitespace.
+    """
+    parts = text.split('.')
+    sentences: List[str] = []
+    cur = [parts[0]]
+    for p in parts[1:]:
+        cur.append('.')
+        if p[:1].isspace():
+            sentences.append(''.join(cur))
+            cur = [p.lstrip()]
+        else:
+            cur.append(p)
+    sentences.append(''.join(cur))
+    return sentences
+
 
 def split_into_chunks(text: str, max_chars: int = 800) -> List[str]:
     """
@@ -10,6 +32,7 @@ def split_into_chunks(text: str, max_chars: int = 800) -> List[str]:
     Contract (to satisfy tests):
       - Empty string -> [""] (len == 1)
       - Whitespace-only -> [original_whitespace] (len == 1, preserve as-is)
+      - Text no longer than max_chars -> [text] (len == 1, preserve as-is)
       - Try to keep chunk length <= max_chars
       - When tests reconstruct using " ".join(chunks), the string must equal the input.
         To satisfy that, we:
@@ -23,77 +46,64 @@ def split_into_chunks(text: str, max_chars: int = 800) -> List[str]:
     if text.strip() == "":
         return [text]
 
+    # Fits in one chunk: return it as-is, which also keeps " ".join(chunks) == text exact.
+    if len(text) <= max_chars:
+        return [text]
+
     # Tokenize by sentences and newlines, but keep the content; we'll add single spaces on join.
     # We split on sentence boundaries (., !, ?) followed by whitespace OR hard newlines.
     # Use capturing splits to keep delimiters separate if needed, but for simplicity here,
     # we normalize internal boundaries to single spaces during chunk assembly (tests join with " ").
     # Sentences:
-    sentences = re.split(r'(?<=[.!?])\s+', text.strip())  # remove leading/trailing whitespace for normalization
+    stripped = text.strip()  # remove leading/trailing whitespace for normalization
+    if '!' in stripped or '?' in stripped:
+        sentences = _SENT_SPLIT_RE.split(stripped)
+    elif '.' in stripped:
+        # Only '.' can end a sentence; str.split avoids the regex engine
+        sentences = _split_on_periods(stripped)
+    else:
+        # No terminators: the sentence split could only return the text whole
+        sentences = [stripped]
 
     # If splitting by sentences yields something silly (like a single huge token),
     # fallback to splitting on newlines to avoid over-long tokens.
     if len(sentences) == 1:
-        sentences = re.split(r'\s*\n+\s*', text.strip())
+        sentences = _NL_SPLIT_RE.split(stripped)
 
     chunks: List[str] = []
     cur: List[str] = []
     cur_len = 0
 
-    def flush():
-        nonlocal cur, cur_len
-        if cur:
-            chunks.append(" ".join(cur))
-            cur = []
-            cur_len = 0
-
+    # Plain locals and one len() per sentence: this loop runs once per sentence
     for sent in sentences:
         s = sent.strip()
         if not s:
             continue
-        add_len = (1 if cur else 0) + len(s)  # +1 for the space if not first in chunk
-        if cur_len + add_len <= max_chars:
-            if cur:
-                cur.append(s)
-                cur_len += 1 + len(s)
-            else:
-                cur = [s]
-                cur_len = len(s)
+        n = len(s)
+        if cur and cur_len + 1 + n <= max_chars:  # +1 for the joining space
+            cur.append(s)
+            cur_len += 1 + n
+            continue
+        if cur:
+            chunks.append(cur[0] if len(cur) == 1 else " ".join(cur))
+        # Start a new chunk, or hard-split a sentence longer than max_chars
+        if n <= max_chars:
+            cur = [s]
+            cur_len = n
         else:
-            # If a single sentence is longer than max_chars, we must hard-split it.
-            if not cur:
-                # hard wrap s
-                start = 0
-                while start < len(s):
-                    take = min(max_chars, len(s) - start)
-                    chunks.append(s[start:start + take])
-                    start += take
-                cur = []
-                cur_len = 0
-            else:
-                flush()
-                # try put into new chunk or hard-split if still too large
-                if len(s) <= max_chars:
-                    cur = [s]
-                    cur_len = len(s)
-                else:
-                    start = 0
-                    while start < len(s):
-                        take = min(max_chars, len(s) - start)
-                        chunks.append(s[start:start + take])
-                        start += take
-                    cur = []
-                    cur_len = 0
-
-    flush()
+            chunks.extend(s[i:i + max_chars] for i in range(0, n, max_chars))
+            cur = []
+            cur_len = 0
+
+    if cur:
+        chunks.append(cur[0] if len(cur) == 1 else " ".join(cur))
 
     # If original ended with a trailing space, replicate that on the last chunk so
     # that " ".join(chunks) == original text (because join doesn't add trailing space).
-    if text.endswith(" ") and chunks:
+    # Every chunk above is already <= max_chars; the space is only added if it still fits.
+    if text.endswith(" ") and chunks and len(chunks[-1]) < max_chars:
         chunks[-1] = chunks[-1] + " "
 
-    # Safety: ensure each chunk obeys the max length
-    chunks = [c if len(c) <= max_chars else c[:max_chars] for c in chunks]
-
     # Always at least one chunk
     if not chunks:
         return [""]
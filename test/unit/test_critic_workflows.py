@@ -0,0 +1,96 @@
+"""
+Unit tests for critic workflows.
+
+Tests the concurrent reviewer fan-out with the agent registry mocked out,
+so no model calls are made.
+"""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from backend.app.services import critic_workflows
+from backend.app.services.critic_workflows import run_all_reviews
+
+
+def _reply(content: str) -> SimpleNamespace:
+    return SimpleNamespace(messages=[SimpleNamespace(content=content)])
+
+
+def _registry(bias, completeness, security) -> SimpleNamespace:
+    agents = {"bias_reviewer": bias, "completeness_reviewer": completeness, "security_reviewer": security}
+
+    async def run(name, task):
+        return await agents[name](task)
+
+    return SimpleNamespace(run=run)
+
+
+class TestRunAllReviews:
+    """Test cases for the parallel reviewer batch."""
+
+    @pytest.mark.asyncio
+    async def test_returns_all_three_verdicts(self):
+        """Test each reviewer result is returned in (bias, completeness, security) order."""
+        registry = _registry(
+            AsyncMock(return_value=_reply('{"verdict": "pass"}')),
+            AsyncMock(return_value=_reply('{"verdict": "fail"}')),
+            AsyncMock(return_value=_reply('{"verdict": "warn"}')),
+        )
+        with patch.object(critic_workflows, "agent_registry", registry):
+            bias, comp, sec = await run_all_reviews("summary", "context")
+
+        assert bias["verdict"] == "pass"
+        assert comp["verdict"] == "fail"
+        assert sec["verdict"] == "warn"
+
+    @pytest.mark.asyncio
+    async def test_failing_reviewer_does_not_abort_batch(self):
+        """Test an exception or timeout in one reviewer is returned, not raised."""
+        async def _slow(task):
+            await asyncio.sleep(1)
+            return _reply('{"verdict": "pass"}')
+
+        registry = _registry(
+            AsyncMock(side_effect=RuntimeError("boom")),
+            _slow,
+            AsyncMock(return_value=_reply('{"verdict": "pass"}')),
+        )
+        with patch.object(critic_workflows, "agent_registry", registry):
+            bias, comp, sec = await run_all_reviews("summary", timeout=0.05)
+
+        assert isinstance(bias, RuntimeError)
+        assert isinstance(comp, asyncio.TimeoutError)
+        assert sec["verdict"] == "pass"
+
+    @pytest.mark.asyncio
+    async def test_timed_out_reviewer_run_is_not_cancelled(self):
+        """Test a reviewer past its timeout keeps running so its agent turn completes."""
+        finished = asyncio.Event()
+
+        async def _slow(task):
+            await asyncio.sleep(0.1)
+            finished.set()
+            return _reply('{"verdict": "pass"}')
+
+        ok = AsyncMock(return_value=_reply('{"verdict": "pass"}'))
+        with patch.object(critic_workflows, "agent_registry", _registry(_slow, ok, ok)):
+            bias, _, _ = await run_all_reviews("summary", timeout=0.01)
+            assert isinstance(bias, asyncio.TimeoutError)
+            await asyncio.wait_for(finished.wait(), 1)
+
+
+class TestSafeJson:
+    """Test cases for critic response parsing."""
+
+    def test_parses_json_with_surrounding_whitespace(self):
+        """Test a JSON object padded with whitespace is parsed."""
+        assert critic_workflows._safe_json('  {"verdict": "pass"}\n') == {"verdict": "pass"}
+
+    def test_prose_response_is_wrapped_as_failure(self):
+        """Test non-JSON prose is reported as a parse failure."""
+        result = critic_workflows._safe_json('Sure! Here is my review: {"verdict": "pass"}')
+
+        assert result["verdict"] == "fail"
+        assert result["parse_error"] is True
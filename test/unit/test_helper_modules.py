@@ -0,0 +1,122 @@
+"""
+Unit tests for the synchronous helper modules under test/unit.
+
+test_mcp_server.py and test_chunk_utils.py hold helper implementations rather than
+test cases; these tests exercise them directly.
+"""
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from test.unit import test_chunk_utils as chunk_helpers
+from test.unit import test_mcp_server as mcp_helpers
+
+
+@pytest.fixture(autouse=True)
+def _empty_kb():
+    mcp_helpers._KB.clear()
+    mcp_helpers._INDEX.clear()
+    yield
+    mcp_helpers._KB.clear()
+    mcp_helpers._INDEX.clear()
+
+
+class TestKBHelpers:
+    """Test cases for the in-memory KB helper and its inverted index."""
+
+    def test_search_on_empty_kb(self):
+        """Test searching before anything is indexed."""
+        assert mcp_helpers.kb_search("anything") == "KB is empty."
+
+    def test_query_term_matches_inside_indexed_tokens(self):
+        """Test a query term hits chunks where it is only part of a word."""
+        mcp_helpers.kb_add("a", "The weather is mild.")
+        mcp_helpers.kb_add("b", "Contract Renewals are due in March.")
+
+        assert mcp_helpers.kb_search("renewal", top_k=1) == "Contract Renewals are due in March."
+
+    def test_ranking_counts_matched_terms_and_keeps_kb_order_on_ties(self):
+        """Test chunks matching more query terms rank first, ties in insertion order."""
+        mcp_helpers.kb_add("a", "alpha only")
+        mcp_helpers.kb_add("b", "alpha and beta")
+        mcp_helpers.kb_add("c", "beta only")
+
+        assert mcp_helpers.kb_search("alpha beta", top_k=3).split("\n") == [
+            "alpha and beta",
+            "alpha only",
+            "beta only",
+        ]
+
+    def test_no_match_falls_back_to_earliest_chunks(self):
+        """Test a query with no hits still returns the first chunks."""
+        mcp_helpers.kb_add("a", "first chunk")
+        mcp_helpers.kb_add("b", "second chunk")
+
+        assert mcp_helpers.kb_search("zzz", top_k=1) == "first chunk"
+
+
+class TestExtractTextHelper:
+    """Test cases for extension dispatch in the extract_text helper."""
+
+    def test_html_bytes_and_str_give_same_text(self):
+        """Test markup is stripped identically from raw bytes and decoded text."""
+        html = "<html><script>var x = 1;</script><style>p {}</style><p>Café <b>menu</b></p></html>"
+
+        assert mcp_helpers._html_to_text(html.encode("utf-8")) == "Café menu"
+        assert mcp_helpers._html_to_text(html) == "Café menu"
+
+    def test_html_file(self, tmp_path):
+        """Test .html files are read as bytes and stripped of markup."""
+        path = tmp_path / "page.html"
+        path.write_text("<h1>Title</h1><p>Body  text</p>", encoding="utf-8")
+
+        assert mcp_helpers.extract_text(str(path)) == "Title Body text"
+
+    def test_unknown_extension_reads_plain_text(self, tmp_path):
+        """Test an unlisted extension falls back to a plain read."""
+        path = tmp_path / "notes.xyz"
+        path.write_text("<b>kept as-is</b>", encoding="utf-8")
+
+        assert mcp_helpers.extract_text(str(path)) == "<b>kept as-is</b>"
+
+    def test_pdf_uses_patched_reader_and_skips_empty_pages(self, tmp_path):
+        """Test the pdf reader global can be patched and empty pages are dropped."""
+        path = tmp_path / "doc.pdf"
+        path.write_bytes(b"%PDF")
+        pages = [MagicMock(), MagicMock(), MagicMock()]
+        for page, text in zip(pages, ["Page one", "", "Page three"]):
+            page.extract_text.return_value = text
+        reader = MagicMock(return_value=MagicMock(pages=pages))
+
+        with patch.object(mcp_helpers, "PdfReader", reader):
+            assert mcp_helpers.extract_text(str(path)) == "Page one\nPage three"
+
+    def test_missing_pdf_raises_even_with_mocked_reader(self, tmp_path):
+        """Test a missing pdf is reported although the mocked parser never opens it."""
+        with patch.object(mcp_helpers, "PdfReader", MagicMock()):
+            with pytest.raises(FileNotFoundError):
+                mcp_helpers.extract_text(str(tmp_path / "missing.pdf"))
+
+
+class TestChunkHelper:
+    """Test cases for the split_into_chunks helper."""
+
+    def test_short_text_is_returned_as_is(self):
+        """Test text within max_chars comes back untouched, whitespace included."""
+        text = "  One. Two!  "
+
+        assert chunk_helpers.split_into_chunks(text, max_chars=50) == [text]
+
+    def test_period_split_matches_sentence_regex(self):
+        """Test the str.split path agrees with the sentence regex on '.'-only text."""
+        for text in ["a. b. c", "v1.2 is out. Next.", "ends with dot.", "x.  y.\tz"]:
+            assert chunk_helpers._split_on_periods(text) == chunk_helpers._SENT_SPLIT_RE.split(text)
+
+    def test_long_text_round_trips_through_join(self):
+        """Test chunks stay within max_chars and rejoin to the input."""
+        text = "First sentence here. Second one follows. Third closes it."
+
+        chunks = chunk_helpers.split_into_chunks(text, max_chars=25)
+
+        assert all(len(c) <= 25 for c in chunks)
+        assert " ".join(chunks) == text
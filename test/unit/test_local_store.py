@@ -0,0 +1,144 @@
+"""
+Unit tests for the local JSON document store.
+
+Each test points the store at a fresh index file under a temporary directory.
+"""
+import pytest
+
+from storage import local_store
+
+
+@pytest.fixture(autouse=True)
+def _tmp_index(tmp_path, monkeypatch):
+    monkeypatch.setattr(local_store, "DOCS_FILE", str(tmp_path / "docs_index.json"))
+    monkeypatch.setattr(local_store, "RAW_DIR", str(tmp_path / "raw"))
+    monkeypatch.setattr(local_store.settings, "data_dir", str(tmp_path))
+
+
+class TestAppendReviewsBatch:
+    """Test cases for batched review writes."""
+
+    def test_appends_all_reviews_in_order(self):
+        """Test every (type, payload) pair is stored after existing reviews."""
+        local_store.put_document("doc1", raw_text="text")
+        local_store.append_review("doc1", "first", {"n": 0})
+
+        local_store.append_reviews_batch("doc1", [("bias", {"n": 1}), ("security", {"n": 2})])
+
+        reviews = local_store.get_document("doc1")["reviews"]
+        assert [r["type"] for r in reviews] == ["first", "bias", "security"]
+        assert reviews[2]["payload"] == {"n": 2}
+
+    def test_disagreements_written_with_reviews(self):
+        """Test disagreements passed alongside reviews land in the same document."""
+        local_store.put_document("doc1", raw_text="text")
+
+        local_store.append_reviews_batch("doc1", [("bias", {"n": 1})], [("summary_review", {"d": 1})])
+
+        doc = local_store.get_document("doc1")
+        assert [r["type"] for r in doc["reviews"]] == ["bias"]
+        assert doc["disagreements"][0]["phase"] == "summary_review"
+        assert doc["disagreements"][0]["details"] == {"d": 1}
+
+    def test_unknown_document_is_ignored(self):
+        """Test reviews for a document that was never stored are dropped."""
+        local_store.append_reviews_batch("missing", [("bias", {"n": 1})])
+
+        assert local_store.get_document("missing") is None
+
+
+class TestIndexCache:
+    """Test cases for the in-memory index cache."""
+
+    def test_repeated_reads_parse_file_once(self, monkeypatch):
+        """Test unchanged index files are served from the cache."""
+        local_store.put_document("doc1", raw_text="text")
+        local_store._CACHE["key"] = None
+        calls = []
+        real_loads = local_store._loads
+        monkeypatch.setattr(local_store, "_loads", lambda data: calls.append(1) or real_loads(data))
+
+        local_store.get_document("doc1")
+        local_store.get_document("doc1")
+
+        assert len(calls) == 1
+
+    def test_external_change_is_reloaded(self):
+        """Test a rewrite of the index file by another process is picked up."""
+        local_store.put_document("doc1", raw_text="text")
+        with open(local_store.DOCS_FILE, "w", encoding="utf-8") as f:
+            f.write('{"doc2": {"doc_id": "doc2", "raw_text": "other text"}}')
+
+        assert local_store.get_document("doc1") is None
+        assert local_store.get_document("doc2")["raw_text"] == "other text"
+
+    def test_returned_documents_do_not_alias_cache(self):
+        """Test mutating a read result leaves the cached index untouched."""
+        local_store.put_document("doc1", raw_text="text", entities=["Acme"])
+
+        local_store.get_document("doc1", with_raw=False)["entities"].append("Globex")
+        local_store.all_docs()["doc1"]["summary"] = "changed"
+
+        doc = local_store.get_document("doc1")
+        assert doc["entities"] == ["Acme"]
+        assert doc["summary"] == ""
+
+
+class TestSingleAppends:
+    """Test cases for single review/disagreement appends."""
+
+    def test_append_review_is_written_immediately(self):
+        """Test a single review and disagreement are on disk as soon as the call returns."""
+        local_store.put_document("doc1", raw_text="text")
+        local_store.append_review("doc1", "bias", {"n": 1})
+        local_store.append_disagreement("doc1", "summary_review", {"d": 1})
+
+        with open(local_store.DOCS_FILE, "rb") as f:
+            doc = local_store._loads(f.read())["doc1"]
+        assert doc["reviews"][0]["type"] == "bias"
+        assert doc["disagreements"][0]["phase"] == "summary_review"
+
+
+class TestRawTextStorage:
+    """Test cases for keeping raw_text out of the index file."""
+
+    def test_raw_text_round_trips_outside_index(self):
+        """Test raw_text is stored in its own file and returned by get_document."""
+        local_store.put_document("doc1", raw_text="long raw text", summary="s")
+
+        with open(local_store.DOCS_FILE, "rb") as f:
+            assert "raw_text" not in local_store._loads(f.read())["doc1"]
+        assert local_store.get_document("doc1")["raw_text"] == "long raw text"
+
+    def test_metadata_only_read_skips_raw_text(self):
+        """Test with_raw=False returns metadata without raw_text."""
+        local_store.put_document("doc1", raw_text="long raw text", summary="s")
+
+        doc = local_store.get_document("doc1", with_raw=False)
+
+        assert doc["summary"] == "s"
+        assert "raw_text" not in doc
+
+
+class TestUpdateSummary:
+    """Test cases for summary/entity edits."""
+
+    def test_unchanged_edit_skips_write(self, monkeypatch):
+        """Test saving the stored summary and entities again does not rewrite the index."""
+        local_store.put_document("doc1", raw_text="text", summary="s", entities=["Acme"])
+        writes = []
+        monkeypatch.setattr(local_store, "_write_atomic", lambda path, data: writes.append(path))
+
+        local_store.update_summary("doc1", "s", ["Acme"])
+        local_store.update_summary("doc1", "s")
+
+        assert writes == []
+
+    def test_changed_summary_is_written(self):
+        """Test a new summary is persisted."""
+        local_store.put_document("doc1", raw_text="text", summary="s")
+
+        local_store.update_summary("doc1", "new summary")
+
+        with open(local_store.DOCS_FILE, "rb") as f:
+            assert local_store._loads(f.read())["doc1"]["summary"] == "new summary"
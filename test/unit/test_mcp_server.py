@@ -4,26 +4,49 @@ Synchronous MCP server helpers used by tests.
 The unit tests call these functions without awaiting them, so do NOT make them async.
 """
 
+import heapq
 import os
 import re
-from typing import List, Tuple
+from collections import Counter, defaultdict
+from typing import Any, Callable, DefaultDict, Dict, List, Set, Tuple, Union
+
+# Optional parsers, imported on first pdf/docx extraction and cached in these globals
+# (patched in tests). _UNSET: not imported yet; None: not installed.
+_UNSET: Any = object()
+PdfReader: Any = _UNSET
+Document: Any = _UNSET
+
+
+def _pdf_reader() -> Any:
+    global PdfReader
+    if PdfReader is _UNSET:
+        try:
+            from PyPDF2 import PdfReader as reader
+        except Exception:
+            reader = None
+        PdfReader = reader
+    return PdfReader
+
+
+def _docx_document() -> Any:
+    global Document
+    if Document is _UNSET:
+        try:
+            from docx import Document as document
+        except Exception:
+            document = None
+        Document = document
+    return Document
 
-# Optional imports (patched in tests for pdf/docx)
-try:
-    from PyPDF2 import PdfReader  # patched in tests
-except Exception:
-    PdfReader = None  # type: ignore
-
-try:
-    from docx import Document  # patched in tests
-except Exception:
-    Document = None  # type: ignore
 
 # Bring in the chunker used by KB
 from backend.app.services.chunk_utils import split_into_chunks
 
-# In-memory KB: list of (doc_id, chunk_text)
-_KB: List[Tuple[str, str]] = []
+# In-memory KB: list of (doc_id, chunk_text, chunk_text.lower())
+_KB: List[Tuple[str, str, str]] = []
+# Inverted index over _KB: lowercased \w+ token -> positions in _KB
+_INDEX: DefaultDict[str, Set[int]] = defaultdict(set)
+_TOKEN_RE = re.compile(r"\w+")
 
 
 # -------------------------
@@ -32,63 +55,92 @@ _KB: List[Tuple[str, str]] = []
 _TAG_RE = re.compile(r"<[^>]+>")
 _SCRIPT_BLOCK_RE = re.compile(r"<script\b[^>]*>.*?</script\s*>", re.IGNORECASE | re.DOTALL)
 _STYLE_BLOCK_RE = re.compile(r"<style\b[^>]*>.*?</style\s*>", re.IGNORECASE | re.DOTALL)
-
-
-def _html_to_text(html: str) -> str:
-    # remove scripts/styles
-    cleaned = _SCRIPT_BLOCK_RE.sub("", html)
-    cleaned = _STYLE_BLOCK_RE.sub("", cleaned)
-    # remove all tags
-    cleaned = _TAG_RE.sub(" ", cleaned)
-    # collapse whitespace
-    cleaned = re.sub(r"\s+", " ", cleaned).strip()
+# Same patterns over raw file bytes: UTF-8 multi-byte sequences never contain '<' or '>',
+# so markup is found without decoding, and only the remaining text is decoded.
+# A non-ASCII letter after the tag name must not count as a word boundary, as in the
+# str patterns, hence the lookahead instead of \b.
+_TAG_RE_B = re.compile(rb"<[^>]+>")
+_SCRIPT_BLOCK_RE_B = re.compile(rb"<script(?![\w\x80-\xff])[^>]*>.*?</script\s*>", re.IGNORECASE | re.DOTALL)
+_STYLE_BLOCK_RE_B = re.compile(rb"<style(?![\w\x80-\xff])[^>]*>.*?</style\s*>", re.IGNORECASE | re.DOTALL)
+
+
+def _html_to_text(html: Union[str, bytes]) -> str:
+    if isinstance(html, bytes):
+        # remove scripts/styles and tags, then decode what is left
+        cleaned_b = _SCRIPT_BLOCK_RE_B.sub(b"", html)
+        cleaned_b = _STYLE_BLOCK_RE_B.sub(b"", cleaned_b)
+        cleaned = _TAG_RE_B.sub(b" ", cleaned_b).decode("utf-8", errors="ignore")
+    else:
+        # remove scripts/styles
+        cleaned = _SCRIPT_BLOCK_RE.sub("", html)
+        cleaned = _STYLE_BLOCK_RE.sub("", cleaned)
+        # remove all tags
+        cleaned = _TAG_RE.sub(" ", cleaned)
+    # collapse whitespace (str.split() also drops leading/trailing runs)
+    cleaned = " ".join(cleaned.split())
     return cleaned
 
 
 # -------------------------
 # File/Text extraction
 # -------------------------
+def _read_text(path: str) -> str:
+    # open() raises FileNotFoundError itself; no separate exists() stat
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        return f.read()
+
+
+def _read_html(path: str) -> str:
+    with open(path, "rb") as f:
+        return _html_to_text(f.read())
+
+
+def _require_file(path: str) -> None:
+    # The pdf/docx parsers are mocked in tests and never open the file, so check here
+    if not os.path.exists(path):
+        raise FileNotFoundError(path)
+
+
+def _read_pdf(path: str) -> str:
+    _require_file(path)
+    reader_cls = _pdf_reader()
+    if reader_cls is None:
+        # Fallback: just read raw bytes as text
+        with open(path, "rb") as f:
+            return f.read().decode("utf-8", errors="ignore")
+    reader = reader_cls(path)
+    # Pages are fed to join lazily (extract_text is mocked in tests); empty pages are skipped
+    pages = getattr(reader, "pages", [])
+    return "\n".join(txt for page in pages if (txt := page.extract_text())).strip()  # type: ignore
+
+
+def _read_docx(path: str) -> str:
+    _require_file(path)
+    document_cls = _docx_document()
+    if document_cls is None:
+        return ""
+    doc = document_cls(path)  # mocked in tests
+    return "\n".join(p.text for p in getattr(doc, "paragraphs", [])).strip()
+
+
+# Extension -> reader; anything not listed is read as plain text
+# (tests expect unsupported extensions such as .xyz to fall back to a plain read)
+_EXT_HANDLERS: Dict[str, Callable[[str], str]] = {
+    ".txt": _read_text,
+    ".html": _read_html,
+    ".htm": _read_html,
+    ".pdf": _read_pdf,
+    ".docx": _read_docx,
+}
+
+
 def extract_text(path: str) -> str:
     """
     Extract text from txt/html/pdf/docx. For unknown extensions, read as text.
     Raise FileNotFoundError when file does not exist.
     """
-    if not os.path.exists(path):
-        raise FileNotFoundError(path)
-
     ext = os.path.splitext(path)[1].lower()
-
-    if ext in (".txt", ".xyz"):  # tests expect unsupported -> fallback to plain read
-        with open(path, "r", encoding="utf-8", errors="ignore") as f:
-            return f.read()
-
-    if ext in (".html", ".htm"):
-        with open(path, "r", encoding="utf-8", errors="ignore") as f:
-            return _html_to_text(f.read())
-
-    if ext == ".pdf":
-        if PdfReader is None:
-            # Fallback: just read raw bytes as text
-            with open(path, "rb") as f:
-                return f.read().decode("utf-8", errors="ignore")
-        reader = PdfReader(path)
-        texts = []
-        for page in getattr(reader, "pages", []):
-            # mocked in tests
-            txt = page.extract_text()  # type: ignore
-            if txt:
-                texts.append(txt)
-        return "\n".join(texts).strip()
-
-    if ext == ".docx":
-        if Document is None:
-            return ""
-        doc = Document(path)  # mocked in tests
-        return "\n".join(p.text for p in getattr(doc, "paragraphs", [])).strip()
-
-    # Fallback for anything else: read as text
-    with open(path, "r", encoding="utf-8", errors="ignore") as f:
-        return f.read()
+    return _EXT_HANDLERS.get(ext, _read_text)(path)
 
 
 # -------------------------
@@ -110,10 +162,18 @@ def kb_add(doc_id: str, text: str, *, max_chars: int = 500) -> str:
     # If the single chunk is just whitespace, consider it 0
     effective: List[str] = [c for c in chunks if c.strip() != ""]
     for c in effective:
-        _KB.append((doc_id, c))
+        _kb_append(doc_id, c)
     return f"Indexed {len(effective)} chunks for {doc_id}"
 
 
+def _kb_append(doc_id: str, chunk: str) -> None:
+    cl = chunk.lower()
+    pos = len(_KB)
+    _KB.append((doc_id, chunk, cl))
+    for tok in set(_TOKEN_RE.findall(cl)):
+        _INDEX[tok].add(pos)
+
+
 def kb_search(query: str, *, top_k: int = 3) -> str:
     """
     Very simple search: return the first top_k chunks containing any query term,
@@ -127,18 +187,26 @@ def kb_search(query: str, *, top_k: int = 3) -> str:
         hits = _KB[:top_k]
     else:
         terms = [t for t in re.split(r"\W+", q) if t]
-        def score(chunk: str) -> int:
-            text_l = chunk.lower()
-            return sum(term in text_l for term in terms)
-
-        ranked = sorted(_KB, key=lambda item: score(item[1]), reverse=True)
-        hits = [item for item in ranked if score(item[1]) > 0][:top_k]
+        # A term is all \w chars, so it occurs in a chunk iff it occurs inside one of the
+        # chunk's \w+ tokens: score only chunks posted under an indexed token containing it.
+        # Each term adds its multiplicity, as the per-chunk `term in chunk` sum did.
+        scores: Dict[int, int] = defaultdict(int)
+        for term, weight in Counter(terms).items():
+            matched: Set[int] = set()
+            for tok, postings in _INDEX.items():
+                if term in tok:
+                    matched |= postings
+            for i in matched:
+                scores[i] += weight
+        # nlargest over ascending positions keeps KB order among ties, like a stable sort
+        top = heapq.nlargest(top_k, sorted(scores), key=scores.__getitem__)
+        hits = [_KB[i] for i in top]
         if not hits:
             # Return something even if not relevant (as the test expects non-empty)
             hits = _KB[:top_k]
 
     # Return as a joined string (tests just check substrings exist / non-empty)
-    return "\n".join(c for _, c in hits)
+    return "\n".join(c for _, c, _ in hits)
 
 
 # -------------------------
@@ -146,8 +214,7 @@ def kb_search(query: str, *, top_k: int = 3) -> str:
 # -------------------------
 def file_read(path: str) -> str:
     """Read file text or raise FileNotFoundError."""
-    if not os.path.exists(path):
-        raise FileNotFoundError(path)
+    # open() raises FileNotFoundError itself
     with open(path, "r", encoding="utf-8", errors="ignore") as f:
         return f.read()
 
@@ -8,6 +8,7 @@ import pytest
 import tempfile
 import os
 from unittest.mock import patch, mock_open
+from mcp_server import server
 from mcp_server.server import _load_kb, _save_kb
 
 
@@ -32,9 +33,9 @@ class TestKnowledgeBaseOperations:
     def test_kb_empty_initialization(self):
         """Test KB initialization when file doesn't exist."""
         # Remove KB file if it exists
-        kb_path = os.path.join(os.path.dirname(__file__), "..", "..", "mcp_server", "kb_store.json")
-        if os.path.exists(kb_path):
-            os.remove(kb_path)
+        for kb_path in {server.KB_PATH, server._LEGACY_KB_PATH}:
+            if os.path.exists(kb_path):
+                os.remove(kb_path)
         
         # Load should create empty KB
         kb = _load_kb()
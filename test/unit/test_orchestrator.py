@@ -0,0 +1,91 @@
+"""
+Unit tests for orchestrator helpers.
+
+Covers turning the parser agent's result into raw_text and chunking it for the KB
+without running any agent.
+"""
+import json
+from types import SimpleNamespace
+
+import pytest
+from autogen_agentchat.messages import TextMessage, ToolCallSummaryMessage
+from autogen_core import FunctionCall
+from autogen_core.models import FunctionExecutionResult
+
+from backend.app.services.exceptions import ParsingError
+from backend.app.services import orchestrator
+from backend.app.services.orchestrator import _parse_result
+from mcp_server import server
+
+
+def _tool_output(content: str, is_error: bool = False) -> SimpleNamespace:
+    msg = ToolCallSummaryMessage(
+        source="parser",
+        content=content,
+        tool_calls=[FunctionCall(id="1", name="mcp_extract_text", arguments="{}")],
+        results=[FunctionExecutionResult(content=content, call_id="1", name="mcp_extract_text", is_error=is_error)],
+    )
+    return SimpleNamespace(messages=[msg])
+
+
+class TestParseResult:
+    """Test cases for reading raw_text out of the parser agent's result."""
+
+    @pytest.mark.asyncio
+    async def test_tool_error_raises_parsing_error(self):
+        """Test a failed extract_text call is not accepted as document text."""
+        for result in (
+            _tool_output("Error executing tool extract_text: no such file", is_error=False),
+            _tool_output("boom", is_error=True),
+        ):
+            with pytest.raises(ParsingError):
+                await _parse_result(result)
+
+    @pytest.mark.asyncio
+    async def test_json_document_text_is_kept_verbatim(self):
+        """Test extracted text that happens to be a JSON object is used as-is."""
+        text = json.dumps({"name": "config", "values": [1, 2]})
+
+        raw_text, sections = await _parse_result(_tool_output(text))
+
+        assert raw_text == text
+        assert sections == []
+
+    @pytest.mark.asyncio
+    async def test_model_envelope_is_unwrapped(self):
+        """Test a model reply with the {sections, raw_text} envelope is unwrapped."""
+        reply = json.dumps({"raw_text": "Body text.", "sections": ["Body text."]})
+        result = SimpleNamespace(messages=[TextMessage(source="parser", content=reply)])
+
+        raw_text, sections = await _parse_result(result)
+
+        assert raw_text == "Body text."
+        assert sections == ["Body text."]
+
+    @pytest.mark.asyncio
+    async def test_plain_model_reply_raises_parsing_error(self):
+        """Test a model reply that is not the JSON envelope (e.g. a refusal) is rejected."""
+        result = SimpleNamespace(messages=[TextMessage(source="parser", content="Sorry, I could not access that file.")])
+
+        with pytest.raises(ParsingError):
+            await _parse_result(result)
+
+
+class TestIndexKB:
+    """Test cases for the chunks ingest sends to the KB."""
+
+    @pytest.mark.asyncio
+    async def test_headings_stay_with_their_paragraphs(self, tmp_path, monkeypatch):
+        """Test kb_add stores sentence-packed chunks, not one entry per paragraph."""
+        monkeypatch.setattr(server, "KB_PATH", str(tmp_path / "kb_store.msgpack"))
+        monkeypatch.setattr(server, "_LEGACY_KB_PATH", str(tmp_path / "kb_store.json"))
+        monkeypatch.setattr(orchestrator, "mcp_kb_add", server.kb_add)
+        paragraphs = ["Renewal Terms", "The contract renews yearly. Notice is due in March."]
+        paragraphs += [f"Section {i}\n\nFiller paragraph number {i} about pricing." for i in range(60)]
+
+        await orchestrator._index_kb("doc1", "\n\n".join(paragraphs))
+
+        chunks = server._load_kb()["docs"]["doc1"]["chunks"]
+        assert all(len(c) <= orchestrator._KB_CHUNK_CHARS for c in chunks)
+        assert len(chunks) < len(paragraphs)
+        assert "Renewal Terms\nThe contract renews yearly." in await server.kb_search("renewal notice", top_k=1)
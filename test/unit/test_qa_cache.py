@@ -0,0 +1,33 @@
+"""
+Unit tests for the Q&A response cache.
+
+Tests key normalization and invalidation behaviour of the exact-match cache.
+"""
+import pytest
+
+from backend.app.services import qa_cache
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    qa_cache.clear()
+    yield
+    qa_cache.clear()
+
+
+class TestQACache:
+    """Test cases for the exact-match Q&A cache."""
+
+    @pytest.mark.asyncio
+    async def test_hit_ignores_case_whitespace_and_context_order(self):
+        """Test a normalized question over the same contexts hits the cache."""
+        await qa_cache.put("What is ML?", ["ctx a", "ctx b"], "Machine learning.")
+
+        assert await qa_cache.get("  what is   ml? ", ["ctx b", "ctx a"]) == "Machine learning."
+
+    @pytest.mark.asyncio
+    async def test_miss_when_contexts_change(self):
+        """Test different retrieved contexts produce a cache miss."""
+        await qa_cache.put("What is ML?", ["ctx a"], "Machine learning.")
+
+        assert await qa_cache.get("What is ML?", ["ctx c"]) is None
@@ -0,0 +1,48 @@
+"""
+Unit tests for the AutoGen tool wrappers.
+
+Tests the in-process kb_search result cache without starting the MCP server.
+"""
+import pytest
+
+from agents import tool_wrappers
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    tool_wrappers.clear_kb_search_cache()
+    yield
+    tool_wrappers.clear_kb_search_cache()
+
+
+class TestKBSearchCache:
+    """Test cases for caching kb_search results."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_query_is_served_from_cache(self, monkeypatch):
+        """Test a normalized repeat query does not call the MCP server again."""
+        calls = []
+
+        async def fake_call(tool, args):
+            calls.append(args["query"])
+            return "chunk"
+
+        monkeypatch.setattr(tool_wrappers.mcp_bridge, "call", fake_call)
+
+        assert await tool_wrappers.mcp_kb_search("Renewal date") == "chunk"
+        assert await tool_wrappers.mcp_kb_search("  renewal DATE ") == "chunk"
+        assert calls == ["Renewal date"]
+
+    @pytest.mark.asyncio
+    async def test_search_in_flight_across_clear_is_not_cached(self, monkeypatch):
+        """Test a result fetched while the KB changed is returned but not stored."""
+        results = iter(["stale", "fresh"])
+
+        async def fake_call(tool, args):
+            tool_wrappers.clear_kb_search_cache()  # a kb_add lands mid-search
+            return next(results)
+
+        monkeypatch.setattr(tool_wrappers.mcp_bridge, "call", fake_call)
+
+        assert await tool_wrappers.mcp_kb_search("renewal") == "stale"
+        assert await tool_wrappers.mcp_kb_search("renewal") == "fresh"
@@ -0,0 +1,39 @@
+"""
+Unit tests for per-agent token usage tracking.
+
+Records usage from fake agent results and reads it back through the /usage route.
+"""
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.app.routes import usage
+from backend.app.services.usage_tracker import usage_tracker
+
+
+@pytest.fixture(autouse=True)
+def _empty_tracker():
+    usage_tracker.reset()
+    yield
+    usage_tracker.reset()
+
+
+class TestUsageTracker:
+    """Test cases for accumulating and exposing agent usage."""
+
+    def test_usage_route_reports_recorded_totals(self):
+        """Test TaskResult and direct-call usage are summed per agent and served by /usage."""
+        result = SimpleNamespace(messages=[
+            SimpleNamespace(models_usage=None),
+            SimpleNamespace(models_usage=SimpleNamespace(prompt_tokens=100, completion_tokens=20)),
+        ])
+        usage_tracker.record("qa", result)
+        usage_tracker.record_usage("qa", SimpleNamespace(prompt_tokens=50, completion_tokens=5))
+
+        app = FastAPI()
+        app.include_router(usage.router)
+        body = TestClient(app).get("/usage").json()
+
+        assert body["agents"]["qa"] == {"calls": 2, "prompt_tokens": 150, "completion_tokens": 25}
@@ -50,6 +50,16 @@ class TestSummaryValidator:
         
         assert not is_valid
         assert details["reason"] == "low_coverage"
+
+    def test_repeated_source_word_counts_once(self):
+        """Test one source word repeated in the summary is a single coverage hit."""
+        raw_text = "Machine learning models need data."
+        summary = "Machine MACHINE machine, followed by unrelated filler words here."
+
+        is_valid, details = SummaryValidator.validate(raw_text, summary)
+
+        assert not is_valid
+        assert details["reason"] == "low_coverage"
     
     def test_validate_good_summary(self):
         """Test validation passes for good summary."""
@@ -137,6 +147,16 @@ class TestEntityValidator:
         assert is_valid
         assert details == {}
 
+    def test_validate_many_entities_presence_ratio(self):
+        """Test presence counting over a large entity list (multi-pattern path)."""
+        raw_text = "Acme Corp and Globex signed with Initech in Springfield."
+        entities = ["acme corp", "GLOBEX", "Initech", "Springfield"] + [f"Missing {i}" for i in range(21)]
+
+        is_valid, details = EntityValidator.validate(raw_text, entities)
+
+        assert not is_valid
+        assert details["present_ratio"] == 4 / 25
+
 
 class TestQAValidator:
     """Test cases for Q&A validation logic."""
@@ -193,6 +213,31 @@ class TestQAValidator:
         ]
         
         is_valid, details = QAValidator.validate(answer, contexts)
-        
+
         assert is_valid
         assert details == {}
+
+    def test_partial_word_matches_do_not_count(self):
+        """Test answer words only embedded in longer context words are not hits."""
+        answer = "Cat art."
+        contexts = ["The category of the article."]
+
+        is_valid, details = QAValidator.validate(answer, contexts)
+
+        assert not is_valid
+        assert details["reason"] == "ungrounded_answer"
+
+
+class TestPreprocessedValidation:
+    """Test cases for validating against shared preprocessed source text."""
+
+    def test_preprocessed_matches_direct_validation(self):
+        """Test summary and entity checks agree with validate() on one shared preprocess."""
+        raw_text = "This is a test document with some content about Machine Learning."
+        summary = "This document discusses machine learning concepts and content."
+        entities = ["Machine Learning", "Quantum Computing"]
+
+        pp = SummaryValidator.preprocess(raw_text)
+
+        assert SummaryValidator.validate_preprocessed(pp, summary) == SummaryValidator.validate(raw_text, summary)
+        assert EntityValidator.validate_preprocessed(pp, entities) == EntityValidator.validate(raw_text, entities)
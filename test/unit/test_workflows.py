@@ -0,0 +1,70 @@
+"""
+Unit tests for agent workflows.
+
+Covers the paths that resolve without calling a model; the QA agent is
+mocked so any unexpected LLM call fails the test.
+"""
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from agents import workflows
+from agents.workflows import QAWorkflow
+
+
+class TestQAWorkflowFastPath:
+    """Test cases for QA answers that skip the LLM."""
+
+    @pytest.mark.asyncio
+    async def test_no_contexts_returns_dont_know(self):
+        """Test empty retrieval answers immediately without the QA agent."""
+        with patch.object(workflows.agent_registry, "run", AsyncMock()) as run:
+            answer, contexts = await QAWorkflow().run("What is ML?", ["", "  "])
+
+        run.assert_not_called()
+        assert answer == QAWorkflow.NO_ANSWER
+        assert contexts == []
+
+    @pytest.mark.asyncio
+    async def test_short_matching_context_is_returned_verbatim(self):
+        """Test a single short context covering the question is quoted directly."""
+        ctx = "The contract renewal date is March 2025."
+        with patch.object(workflows.agent_registry, "run", AsyncMock()) as run:
+            answer, contexts = await QAWorkflow().run("When is the contract renewal?", [ctx])
+
+        run.assert_not_called()
+        assert ctx in answer
+        assert contexts == [ctx]
+
+    @pytest.mark.asyncio
+    async def test_question_punctuation_does_not_drop_terms(self):
+        """Test a term followed by '?' still counts toward the trivial-answer match."""
+        ctx = "The contract renewal date is March 2025."
+        with patch.object(workflows.agent_registry, "run", AsyncMock()) as run:
+            answer, _ = await QAWorkflow().run("Renewal?", [ctx])
+
+        run.assert_not_called()
+        assert ctx in answer
+
+
+class TestCorpusSummarization:
+    """Test cases for the map-reduce corpus summary."""
+
+    @pytest.mark.asyncio
+    async def test_map_phase_uses_direct_model_calls(self):
+        """Test per-document summaries are plain model calls and only the reduce step runs an agent."""
+        docs = [
+            "Acme Corporation signed the supply contract with Globex in March.",
+            "Globex Industries renewed the supply contract with Acme in April.",
+        ]
+        partial = "Acme Corporation and Globex signed the supply contract this spring."
+        reply = SimpleNamespace(messages=[SimpleNamespace(content=partial)])
+        with patch.object(workflows.agent_registry, "complete", AsyncMock(return_value=partial)) as complete, \
+                patch.object(workflows.agent_registry, "run", AsyncMock(return_value=reply)) as run:
+            summary = await workflows.CorpusSummarizationWorkflow().run(docs)
+
+        assert complete.await_count == len(docs)
+        run.assert_awaited_once()
+        assert run.await_args.args[0] == "summarizer"
+        assert summary == partial